@@ -15,6 +15,9 @@ pyprojecttools
     - `pipelines.py`
     - `plotters.py`
     - `__init__.py`
+- `benchmarks`
+    - `import_time.py`
+    - `zip_folder.py`
 - `batch_scripts`
     - `clonepyprojecttools.bat`
     - `tarExtraction.bat`
@@ -53,13 +56,68 @@ pyprojecttools
 ```
 """
 
-from .baseclasses import datareaders, pipelines, plotters
-from .datahelpers import *
-from .dirhelpers import file_filter, mkdirectory
-from .media.photos import make_gif
+import importlib
+
+# Submodules and re-exported names are imported on first access (see `__getattr__`),
+# so `import pyprojecttools` does not load NumPy, Pandas, PyTorch, or Pillow.
+_submodules = {
+    "baseclasses",
+    "datahelpers",
+    "dirhelpers",
+    "dtypes",
+    "errors_exceptions",
+    "iterators",
+    "machinelearning",
+    "media",
+    "monitoring",
+    "plotting",
+    "reports",
+    "strfmts",
+    "transformations",
+    "user_def_warnings",
+    "utilities",
+}
+_aliases = {
+    "datareaders": ".baseclasses.datareaders",
+    "pipelines": ".baseclasses.pipelines",
+    "plotters": ".baseclasses.plotters",
+}
+_attributes = {
+    "ArchiveFileIterator": ".iterators",
+    "DirectoryFileIterator": ".iterators",
+    "file_filter": ".dirhelpers",
+    "make_gif": ".media.photos",
+    "mkdirectory": ".dirhelpers",
+}
+
+
+def __getattr__(name: str):
+    """Lazily imports submodules, their aliases, and re-exported names (including everything from `datahelpers`)."""
+    if name in _submodules:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _aliases:
+        value = importlib.import_module(_aliases[name], __name__)
+    elif name in _attributes:
+        value = getattr(importlib.import_module(_attributes[name], __name__), name)
+    elif not name.startswith("_"):
+        datahelpers = importlib.import_module(".datahelpers", __name__)
+        if not hasattr(datahelpers, name):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(datahelpers, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_submodules, *_aliases, *_attributes})
+
 
 __version__ = "1.2.2"
 __all__ = [
+    "ArchiveFileIterator",
     "datareaders",
     "DirectoryFileIterator",
     "file_filter",
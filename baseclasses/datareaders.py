@@ -9,9 +9,20 @@ class Reader
 	method prepare
 	method read
 	method save
+class MemmapReader
+	method __init__
+	method load
+	method prepare
+	method read
+	method save
 """
 
+import json
+import os
 from abc import ABC, abstractmethod
+from typing import Any, List, Sequence
+
+import numpy as np
 
 from ..dtypes import binaryfiles, tabularfiles
 
@@ -56,3 +67,151 @@ class Reader(ABC):
     @abstractmethod
     def save(self):
         pass
+
+
+class MemmapReader(Reader):
+    """
+    Reader for numeric datasets larger than memory, kept on disk as a 2-D `np.memmap`-backed array.
+
+    The store is a directory (`input_pth`) holding the raw row-major data (`data.bin`) and a small JSON header (`header.json`) with the dtype, shape, and column names. `read()` returns views into the mapping (no copies) for any row slice and for columns that are evenly spaced; `save()` appends rows to the end of the data file.
+
+    Attributes:
+        input_pth (type): Path to the store directory.
+        save_as (type): File extension to save your data as (kept for `Reader` compatibility).
+        dtype (type): Data type of the stored values.
+        columns (type): Column names.
+        shape (type): Shape of the stored array, `(rows, columns)`.
+
+    Inheritance:
+        Reader: Abstract base class for general data-reading objects.
+
+    Args:
+        input_pth (str=None): Path to the store directory.
+        save_as (tabularfiles|binaryfiles=None): File extension to save your data as.
+        dtype (Any=None): Data type for a new store (read from the header for existing stores). Defaults to float64.
+        columns (List[str]=None): Column names for a new store (read from the header for existing stores).
+
+    Example:
+        >>> store = MemmapReader("runs/positions", dtype="float32", columns=["x", "y", "z"])
+        >>> store.prepare()
+        >>> store.save(simulation_step)  # appends rows
+        >>> window = store.read(slice(1_000, 2_000), columns=["x", "z"])  # view, not a copy
+    """
+
+    header_name = "header.json"
+    data_name = "data.bin"
+
+    def __init__(
+        self,
+        input_pth: str = None,
+        save_as: tabularfiles | binaryfiles = None,
+        dtype: Any = None,
+        columns: List[str] = None,
+    ) -> None:
+        super().__init__(input_pth, save_as)
+        self.dtype = np.dtype(dtype or np.float64)
+        self.columns = list(columns) if columns is not None else None
+        self.shape = (0, len(self.columns or []))
+        self._data = None
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def _header_path(self) -> str:
+        return os.path.join(self.input_pth, self.header_name)
+
+    @property
+    def _data_path(self) -> str:
+        return os.path.join(self.input_pth, self.data_name)
+
+    def _write_header(self) -> None:
+        header = {"dtype": self.dtype.str, "shape": self.shape, "columns": self.columns}
+        temp_path = f"{self._header_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(header, file)
+        os.replace(temp_path, self._header_path)
+
+    def prepare(self):
+        """Creates an empty store (directory, header, and data file) if it does not exist yet, otherwise loads it."""
+        if os.path.exists(self._header_path):
+            return self.load()
+        if self.columns is None:
+            raise ValueError("'columns' are required to create a new store")
+        os.makedirs(self.input_pth, exist_ok=True)
+        open(self._data_path, "wb").close()
+        self.shape = (0, len(self.columns))
+        self._write_header()
+        self._data = None
+        return self
+
+    def load(self):
+        """Reads the header and (re-)maps the data file read-only."""
+        with open(self._header_path) as file:
+            header = json.load(file)
+        self.dtype = np.dtype(header["dtype"])
+        self.shape = tuple(header["shape"])
+        self.columns = header["columns"]
+        self._data = (
+            np.memmap(self._data_path, dtype=self.dtype, mode="r", shape=self.shape)
+            if self.shape[0]
+            else np.empty(self.shape, dtype=self.dtype)  # empty files cannot be mapped
+        )
+        return self
+
+    def _column_key(self, columns: Sequence[str | int] = None) -> slice | List[int]:
+        """Turns column names/positions into a slice when they are evenly spaced, so indexing stays a view."""
+        positions = [
+            self.columns.index(column) if isinstance(column, str) else column
+            for column in columns
+        ]
+        if len(positions) == 1:
+            return slice(positions[0], positions[0] + 1)
+        step = positions[1] - positions[0]
+        evenly_spaced = step > 0 and all(
+            after - before == step for before, after in zip(positions, positions[1:])
+        )
+        if not evenly_spaced:
+            return positions
+        return slice(positions[0], positions[-1] + 1, step)
+
+    def read(
+        self, rows: slice | int = slice(None), columns: Sequence[str | int] = None
+    ) -> np.ndarray:
+        """
+        Returns rows (and columns) of the stored array. Row slices and evenly spaced columns are views into the mapping; other column selections need a copy.
+
+        Args:
+            rows (slice | int, optional): Rows to return. Defaults to all rows.
+            columns (Sequence[str | int], optional): Column names or positions to return. Defaults to all columns.
+
+        Returns:
+            np.ndarray: Requested part of the stored array.
+        """
+        if self._data is None:
+            self.load()
+        data = self._data[rows]
+        if columns is None:
+            return data
+        return data[..., self._column_key(columns)]
+
+    def save(self, data: Any = None):
+        """
+        Appends rows to the store (creating it first if needed). DataFrames are reordered to the store's columns.
+
+        Args:
+            data (np.ndarray | DataFrame | Sequence, optional): 2-D data (or a single row) to append.
+        """
+        if self.columns is None and hasattr(data, "columns"):
+            self.columns = list(data.columns)
+        if self._data is None or not os.path.exists(self._header_path):
+            self.prepare()
+        if hasattr(data, "columns"):
+            data = data[self.columns].to_numpy(dtype=self.dtype)
+        rows = np.ascontiguousarray(data, dtype=self.dtype).reshape(-1, self.shape[1])
+
+        with open(self._data_path, "ab") as file:
+            file.write(rows.data)
+        self.shape = (self.shape[0] + rows.shape[0], self.shape[1])
+        self._write_header()
+        return self.load()
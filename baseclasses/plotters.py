@@ -40,6 +40,7 @@ class Plot(ABC):
         figtitle (Tuple[str, bool], optional): Tuple of the figure title and boolean to toggle title centering, i.e., `("Title", True)`. Defaults to None.
         output_dir (str, optional): Directory to output saved plots. Optional, `os.getcwd()` is called when `output_dir` is `None`.
         reduce_data (Plot.reduc_types, optional): Reduces data base on 'levels' (RANGE.low/RANGE.med/RANGE.high) or decimal values between (0, 1). Defaults to None.
+        reduce_method (str, optional): Reduction method passed to `reduce_df`; the default, `"lttb"`, keeps the visual shape of the plotted signal. Defaults to "lttb".
         save_as (str, optional): File name to save plot as. Defaults to None.
         size (str, optional): Tuple figure size. Defaults to None.
 
@@ -64,12 +65,14 @@ class Plot(ABC):
         reduce_data: reduc_types = None,
         save_as: str = None,
         size: str = None,
+        reduce_method: str = "lttb",
     ) -> None:
         self.columns = columns
         self.dataset = dataset
         self.figtitle = figtitle
         self.output_dir = output_dir
         self.reduce_data = reduce_data
+        self.reduce_method = reduce_method
         self.save_as = save_as
         self.size = size
 
@@ -103,7 +106,7 @@ class Plot(ABC):
             ) and self.reduce_data not in [RANGE.low, RANGE.med, RANGE.high]:
                 _msg = "Incorrect value for `RANGE` setter. Use either `RANGE.low`, `RANGE.med`, or `RANGE.high`"
                 raise KeyError(_msg)
-            self._reduce_data(self.reduce_data)
+            self._reduce_data()
 
     def prepdata(self):
         self.dataset = self.dataset[[*self.columns]]
@@ -145,7 +148,13 @@ class Plot(ABC):
         - med = 0.5
         - high = 0.75
 
-        Args:
-            amt (int, optional): New decimal percentage-based size of original dataset. Defaults to None.
+        With the shape-preserving methods (`"lttb"`, `"minmax"`), the last plotted column is treated as the signal and, when at least two columns are plotted, the first as its horizontal axis.
         """
-        self.dataset = reduce_df(self.dataset, self.reduce_data)
+        columns = self.columns or list(self.dataset.columns)
+        self.dataset = reduce_df(
+            self.dataset,
+            self.reduce_data,
+            method=self.reduce_method,
+            x=columns[0] if len(columns) > 1 else None,
+            y=columns[-1],
+        )
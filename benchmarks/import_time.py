@@ -0,0 +1,97 @@
+"""
+Startup-time benchmark for a bare `import pyprojecttools`.
+
+Script Information
+------------------
+- Workspace: pyprojecttools
+- Filename: import_time.py
+- Path: benchmarks\\import_time.py
+
+Imports the package in fresh interpreters and exits with status 1 if the best (lowest) import time exceeds the budget, or if the import loads any of the heavy third-party modules that are supposed to be imported lazily.
+
+Usage
+-----
+```cmd
+py benchmarks/import_time.py --budget 0.1 --runs 5
+```
+
+Script Symbols
+--------------
+- variable `HEAVY_MODULES`
+- function `measure_import`
+- function `main`
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+HEAVY_MODULES = ("numpy", "pandas", "torch", "PIL", "matplotlib")
+"""Third-party modules a bare package import must not load."""
+
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import {package}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [name for name in {heavy!r} if name in sys.modules]]))
+"""
+
+
+def measure_import(package_dir: str = _PACKAGE_DIR) -> Tuple[float, List[str]]:
+    """
+    Imports the package (named after its directory) in a fresh interpreter.
+
+    Args:
+        package_dir (str, optional): Path to the package directory. Defaults to this repository.
+
+    Returns:
+        Tuple[float, List[str]]: Import time in seconds and the heavy modules that were loaded.
+    """
+    snippet = _SNIPPET.format(
+        package=os.path.basename(package_dir), heavy=HEAVY_MODULES
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=os.path.dirname(package_dir),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    return elapsed, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--budget", type=float, default=0.1, help="maximum import time in seconds"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh imports")
+    args = parser.parse_args()
+
+    timings, loaded = [], set()
+    for _ in range(args.runs):
+        elapsed, heavy = measure_import()
+        timings.append(elapsed)
+        loaded.update(heavy)
+
+    best = min(timings)
+    print(f"import time: best {best * 1000:.1f} ms over {args.runs} runs")
+    if loaded:
+        print(f"FAIL: heavy modules loaded at import: {sorted(loaded)}")
+        return 1
+    if best > args.budget:
+        print(f"FAIL: import time exceeds budget of {args.budget * 1000:.1f} ms")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
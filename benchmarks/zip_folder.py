@@ -0,0 +1,123 @@
+"""
+Round-trip check and timing for serial vs. parallel `zip_folder`.
+
+Script Information
+------------------
+- Workspace: pyprojecttools
+- Filename: zip_folder.py
+- Path: benchmarks\\zip_folder.py
+
+Builds a temporary tree of compressible and already-compressed files, archives it with one worker (`ZipFile.write`) and with a process pool (members spliced in by `_write_deflated_member`), and exits with status 1 if either archive fails `ZipFile.testzip`, lists different members, or doesn't reproduce the original file contents.
+
+Usage
+-----
+```cmd
+py benchmarks/zip_folder.py --files 200 --size 200000 --workers 4
+```
+
+Script Symbols
+--------------
+- function `make_tree`
+- function `check_archive`
+- function `main`
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List
+from zipfile import ZIP_STORED, ZipFile
+
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import the package by its directory name, like `import_time.py` does
+sys.path.insert(0, os.path.dirname(_PACKAGE_DIR))
+datahelpers = importlib.import_module(f"{os.path.basename(_PACKAGE_DIR)}.datahelpers")
+
+
+def make_tree(root: str, files: int, size: int) -> Dict[str, bytes]:
+    """
+    Writes `files` files of about `size` bytes under `root` (in nested directories).
+
+    Returns:
+        Dict[str, bytes]: archive member names mapped to the file contents.
+    """
+    contents = {}
+    for i in range(files):
+        name = f"d{i % 7}/s{i % 3}/file_{i}" + (".png" if i % 10 == 0 else ".txt")
+        data = (
+            os.urandom(size // 10)
+            if name.endswith(".png")
+            else (b"row %d;" % i) * (size // 8)
+        )
+        os.makedirs(os.path.join(root, os.path.dirname(name)), exist_ok=True)
+        with open(os.path.join(root, name), "wb") as file:
+            file.write(data)
+        contents[name] = data
+    return contents
+
+
+def check_archive(path: str, contents: Dict[str, bytes]) -> List[str]:
+    """
+    Verifies an archive against the original contents.
+
+    Returns:
+        List[str]: problems found (empty if the archive is correct).
+    """
+    problems = []
+    with ZipFile(path) as archive:
+        bad = archive.testzip()
+        if bad is not None:
+            problems.append(f"{path}: testzip failed on '{bad}'")
+        if sorted(archive.namelist()) != sorted(contents):
+            problems.append(f"{path}: member names differ")
+        for name, data in contents.items():
+            info = archive.getinfo(name)
+            if archive.read(info) != data:
+                problems.append(f"{path}: contents of '{name}' differ")
+            if name.endswith(".png") and info.compress_type != ZIP_STORED:
+                problems.append(f"{path}: '{name}' should be stored")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=200, help="number of files")
+    parser.add_argument("--size", type=int, default=200_000, help="bytes per file")
+    parser.add_argument("--workers", type=int, default=4, help="parallel workers")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "tree")
+        contents = make_tree(root, args.files, args.size)
+
+        with ZipFile(os.path.join(tmp, "probe.zip"), "w") as probe:
+            if not datahelpers._can_splice(probe):
+                print(
+                    "NOTE: ZipFile internals unavailable; parallel mode falls back to ZipFile.write"
+                )
+
+        problems = []
+        for workers in (1, args.workers):
+            path = os.path.join(tmp, f"workers_{workers}.zip")
+            start = time.perf_counter()
+            datahelpers.zip_folder(path, root, max_workers=workers)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{workers} worker(s): {elapsed:.2f} s, {os.path.getsize(path)} bytes"
+            )
+            problems.extend(check_archive(path, contents))
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
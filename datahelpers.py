@@ -11,53 +11,469 @@ Script Information
 
 Functions
 ---------
-- class ParseCfg
+- class ArchiveReader
+- class FileCache
+- class JSONLIndex
+- class ParseConfig
+- class TxtWriter
+- function iter_json_array
+- function read_cache
+- function iter_jsonl
+- function iter_txt
+- function iter_xml
+- function normalize
+- function optimize_dtypes
+- function pull_columns
 - function read_json
 - function read_txt
 - function write_to_excel
+- function to_excel_parallel
+- function to_cache
 - function write_to_json
 - function write_to_txt
+- function tensor_batches
+- function to_jsonl
+- function to_xml
+- function save_dict2xml
+- function zip_folder
+- function zip_extract
+- function extract_tar
 """
 
+from __future__ import annotations
+
+import bz2
+import gzip
+import io
 import json
+import lzma
+import mmap
 import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
 import warnings
-from configparser import ConfigParser
-from typing import Any, Callable, Dict, List, Literal, Sequence, Tuple
-from zipfile import ZipFile
-
-import numpy as np
-import torch
-from pandas import DataFrame, ExcelWriter
+import zlib
+from array import array
+from collections import OrderedDict, deque
+from configparser import ConfigParser, InterpolationError
+from fnmatch import fnmatch
+from itertools import islice
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    IO,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
+from zipfile import (
+    ZIP64_LIMIT,
+    ZIP_DEFLATED,
+    ZIP_STORED,
+    LargeZipFile,
+    ZipFile,
+    ZipInfo,
+    is_zipfile,
+)
+
+from .user_def_warnings import MissingArgumentsWarning, UnavoidableCopyWarning
+
+# NumPy, Pandas, and PyTorch are imported inside the functions that need them,
+# so importing this module (and `pyprojecttools`) stays fast
+if TYPE_CHECKING:
+    import numpy as np
+    import torch
+    from pandas import DataFrame
+
+    from .baseclasses import RANGE
+
+    _reduced_types = DataFrame | List[DataFrame] | Tuple[DataFrame]
 
 # from strfmts import osdate_time
-# from userwarnings import MissingArgumentsWarning
 
-_reduced_types = DataFrame | List[DataFrame] | Tuple[DataFrame]
+_REDUCTION_METHODS = ("head", "stride", "random", "stratified", "minmax", "lttb")
+"""Row-reduction methods supported by `reduce_df`."""
+
+_JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+"""File extensions treated as JSON Lines (one JSON document per line)."""
+
+_JSON_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_JSON_SEPARATORS = re.compile(r"[ \t\r\n,]*")
+
+_COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+    ".zst": "zstd",
+    ".lz4": "lz4",
+}
+"""File extensions of the compression methods supported by `_open_file`."""
+
+_COMPRESSION_MAGIC = {
+    re.compile(rb"\x1f\x8b"): "gzip",
+    re.compile(rb"BZh[1-9](?:1AY&SY|\x17rE8P\x90)"): "bz2",  # block or end-of-stream
+    re.compile(rb"\xfd7zXZ\x00"): "xz",
+    re.compile(rb"\x28\xb5\x2f\xfd"): "zstd",
+    re.compile(rb"\x04\x22\x4d\x18"): "lz4",
+}
+"""Patterns of the leading bytes of files written by the supported compression methods."""
+
+_PLAIN_EXTENSIONS = frozenset(
+    {
+        ".txt",
+        ".text",
+        ".log",
+        ".md",
+        ".csv",
+        ".tsv",
+        ".json",
+        *_JSONL_EXTENSIONS,
+        ".xml",
+        ".html",
+        ".yaml",
+        ".yml",
+        ".toml",
+        ".ini",
+        ".cfg",
+    }
+)
+"""File extensions of text files, which `_detect_compression` never sniffs for magic bytes."""
+
+_MMAP_THRESHOLD = 64 * 1024**2
+"""File size (in bytes) from which `iter_txt` memory-maps the file by default."""
+
+_ARCHIVE_CHUNK_SIZE = 1024**2
+"""Number of bytes read from (or written to) archive members at a time."""
+
+_STORED_EXTENSIONS = frozenset(
+    {
+        ".zip",
+        ".gz",
+        ".tgz",
+        ".bz2",
+        ".xz",
+        ".zst",
+        ".lz4",
+        ".7z",
+        ".rar",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".webp",
+        ".mp3",
+        ".mp4",
+        ".mkv",
+        ".avi",
+        ".mov",
+        ".npz",
+        ".parquet",
+        ".xlsx",
+    }
+)
+"""File extensions `zip_folder` stores without compression (the data is already compressed)."""
+
+
+def _batched(iterable: Iterable = None, size: int = None) -> Iterator[List]:
+    """Yields lists of (at most) `size` consecutive items from `iterable`."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _detect_compression(
+    filename: str = None, mode: str = "r", compression: str | Dict | None = "infer"
+) -> str | None:
+    """Resolves `compression` to a method name (or None), inferring it from the extension or, when reading a file with an unrecognized extension, its magic bytes."""
+    if isinstance(compression, dict):
+        compression = compression.get("method", "infer")
+    if compression != "infer":
+        return compression
+    extension = os.path.splitext(filename)[1].lower()
+    method = _COMPRESSION_EXTENSIONS.get(extension)
+    if method or mode[0] != "r" or extension in _PLAIN_EXTENSIONS:
+        return method
+    with open(filename, "rb") as file:
+        head = file.read(10)
+    return next(
+        (name for magic, name in _COMPRESSION_MAGIC.items() if magic.match(head)),
+        None,
+    )
+
+
+_OPEN_PARAMETERS = (
+    "mode",
+    "buffering",
+    "encoding",
+    "errors",
+    "newline",
+    "closefd",
+    "opener",
+)
+
+
+def _open_arguments(
+    args: Sequence[Any] = (), kwargs: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """
+    Maps positional `open` arguments to their keywords, so they can be forwarded to `_open_file`.
+
+    Raises:
+        TypeError: If there are more positional arguments than `open` takes, or one is also given by keyword.
+    """
+    kwargs = dict(kwargs or {})
+    if len(args) > len(_OPEN_PARAMETERS):
+        _msg = f"open() takes at most {len(_OPEN_PARAMETERS)} arguments after the filename ({len(args)} given)"
+        raise TypeError(_msg)
+    for name, value in zip(_OPEN_PARAMETERS, args):
+        if name in kwargs:
+            _msg = f"open() got multiple values for argument '{name}'"
+            raise TypeError(_msg)
+        kwargs[name] = value
+    return kwargs
+
+
+def _open_file(
+    filename: str = None,
+    mode: str = "r",
+    compression: str | Dict | None = "infer",
+    **kwargs,
+) -> Any:
+    """
+    Opens a plain or compressed file, streaming through the codec (no temporary files).
+
+    Notes:
+    - `compression` is a method name (`"gzip"`, `"bz2"`, `"xz"`, `"zstd"`, `"lz4"`), None for plain files, `"infer"` (from the extension, or from the magic bytes when reading a file whose extension is neither a compression nor a text type), or a dictionary with a `"method"` key and the optional settings `"level"` (compression level) and `"threads"` (worker threads, `zstd` only).
+    - `"zstd"` and `"lz4"` require the `zstandard` and `lz4` packages.
+
+    Args:
+        filename (str, optional): file to open. Defaults to None.
+        mode (str, optional): file mode, text unless it contains `"b"`. Defaults to "r".
+        compression (str | Dict | None, optional): compression method or settings. Defaults to "infer".
+        kwargs: passed to the opener (e.g., `encoding`).
+
+    Returns:
+        file object
+    """
+    settings = compression if isinstance(compression, dict) else {}
+    method = _detect_compression(filename, mode, compression)
+    if method is None:
+        return open(filename, mode, **kwargs)
+
+    level, threads = settings.get("level"), settings.get("threads")
+    if "b" not in mode and "t" not in mode:
+        mode += "t"  # compressed openers default to binary mode
+    match method:
+        case "gzip":
+            return gzip.open(
+                filename, mode, compresslevel=9 if level is None else level, **kwargs
+            )
+        case "bz2":
+            return bz2.open(
+                filename, mode, compresslevel=9 if level is None else level, **kwargs
+            )
+        case "xz":
+            return lzma.open(filename, mode, preset=level, **kwargs)
+        case "zstd":
+            import zstandard
+
+            if mode[0] == "r":
+                # the decompression reader has no `readline`, so buffer it
+                reader = io.BufferedReader(zstandard.open(filename, "rb"))
+                return reader if "b" in mode else io.TextIOWrapper(reader, **kwargs)
+            compressor = zstandard.ZstdCompressor(
+                level=3 if level is None else level, threads=threads or 0
+            )
+            return zstandard.open(filename, mode, cctx=compressor, **kwargs)
+        case "lz4":
+            import lz4.frame
+
+            return lz4.frame.open(
+                filename,
+                mode,
+                compression_level=0 if level is None else level,
+                **kwargs,
+            )
+    raise ValueError(f"Unsupported compression method '{method}'")
+
+
+def _strip_compression(filename: str = None) -> str:
+    """Returns the lowercased file name without a compression extension (e.g., `data.jsonl.gz` -> `data.jsonl`)."""
+    root, extension = os.path.splitext(filename.lower())
+    return root if extension in _COMPRESSION_EXTENSIONS else filename.lower()
+
+
+def _mmap_lines(filename: str = None, offset: int = 0) -> Iterator[bytes]:
+    """Yields raw lines (as `bytes`) of a memory-mapped file, starting at byte `offset`."""
+    with open(filename, "rb") as file:
+        if os.fstat(file.fileno()).st_size <= offset:
+            return  # nothing to read (and empty files cannot be mapped)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            start, end = offset, len(mapped)
+            while start < end:
+                stop = mapped.find(b"\n", start)
+                stop = end if stop == -1 else stop + 1
+                yield mapped[start:stop]
+                start = stop
+
+
+def _file_lines(
+    filename: str = None,
+    binary: bool = False,
+    offset: int = 0,
+    encoding: str = "utf-8",
+    errors: str = "strict",
+    compression: str | Dict | None = "infer",
+) -> Iterator[str | bytes]:
+    """Yields lines of a (possibly compressed) file through a buffered reader, starting at (uncompressed) byte `offset`."""
+    with _open_file(filename, "rb", compression) as file:
+        if file.seekable():
+            file.seek(offset)
+        else:  # e.g., zstd streams, which can only be read forward
+            while offset > 0 and (skipped := file.read(min(offset, 1024**2))):
+                offset -= len(skipped)
+        if binary:
+            yield from file
+        else:
+            yield from io.TextIOWrapper(
+                file, encoding=encoding, errors=errors, newline=""
+            )
+
+
+def _excel_sheets(
+    df: DataFrame | List[DataFrame] | Dict[str, DataFrame] = None,
+    sheetnames: str | List[str] = "Main",
+) -> List[Tuple[str, DataFrame]]:
+    """Pairs each dataframe with its sheet name, enumerating `sheetnames` if a single name is given for several dataframes."""
+    from pandas import DataFrame
+
+    if isinstance(df, DataFrame):
+        return [(sheetnames if isinstance(sheetnames, str) else sheetnames[0], df)]
+    if isinstance(df, dict):
+        return list(df.items())
+    if isinstance(sheetnames, str):
+        sheetnames = [f"{sheetnames}_{number}" for number in range(1, len(df) + 1)]
+    if len(sheetnames) != len(df):
+        _msg = f"Got {len(df)} dataframes but {len(sheetnames)} sheet names"
+        raise ValueError(_msg)
+    return list(zip(sheetnames, df))
+
+
+def _stream_excel(
+    save_as: str = None,
+    sheets: List[Tuple[str, DataFrame]] = None,
+    index: bool = False,
+    chunksize: int = 10_000,
+) -> None:
+    """Writes sheets row by row with `xlsxwriter` in constant-memory mode, converting `chunksize` rows at a time."""
+    try:
+        from xlsxwriter import Workbook
+    except ImportError as error:
+        raise ImportError("Streaming Excel files requires 'xlsxwriter'") from error
+
+    options = {
+        "constant_memory": True,
+        "default_date_format": "yyyy-mm-dd hh:mm:ss",
+        "nan_inf_to_errors": True,
+    }
+    with Workbook(save_as, options) as workbook:
+        for sheetname, data in sheets:
+            worksheet = workbook.add_worksheet(sheetname)
+            header = ([data.index.name or ""] if index else []) + list(
+                map(str, data.columns)
+            )
+            worksheet.write_row(0, 0, header)
+            row = 1
+            for start in range(0, data.shape[0], chunksize):
+                chunk = data.iloc[start : start + chunksize].astype(object)
+                chunk = chunk.where(chunk.notna(), None)
+                for values in chunk.itertuples(index=index, name=None):
+                    worksheet.write_row(row, 0, values)
+                    row += 1
 
 
 def to_excel(
     save_as: str = None,
-    df: DataFrame | List[DataFrame] = None,
+    df: DataFrame | List[DataFrame] | Dict[str, DataFrame] = None,
     sheetnames: str | List[str] = "Main",
     index: bool = False,
+    stream: bool = False,
+    chunksize: int = 10_000,
     **kwargs,
 ):
     """
-    Builds an Microsoft Excel file (`.xlsx` or `.xls`) from single or multiple Pandas dataframes (`pd.DataFrame` object). In the latter case, it will create separate pages for each dataframe using a list of sheetnames. If no sheetname list is provided, an enumerated list will be used.
+    Builds an Microsoft Excel file (`.xlsx` or `.xls`) from single or multiple Pandas dataframes (`pd.DataFrame` object). In the latter case, it will create separate pages for each dataframe using a list of sheetnames (or a dictionary of sheetname-dataframe pairs). If no sheetname list is provided, an enumerated list will be used.
+
+    Notes:
+    - `stream` writes `.xlsx` files row by row through `xlsxwriter`'s constant-memory mode, converting `chunksize` rows at a time, so memory does not grow with the number of rows. Only the values (and the index, if requested) are written; `kwargs` are not used.
+    - Use `to_excel_parallel` to write several workbooks at once.
 
     Args:
         save_as (str, optional): what you want to name the saved file. Defaults to f"untitled_excel_sheet-{osdate_time}.xlsx".
-        df (DataFrame, optional): single dataframe or list of dataframes you want to write to file. Defaults to None.
+        df (DataFrame, optional): single dataframe, list of dataframes, or dictionary of sheetname-dataframe pairs you want to write to file. Defaults to None.
         sheetname (Union[str, List], optional): name or list of names you want to name each excel sheet page. Defaults to 'Main'.
         index (bool, optional): option to write the index of each dataframe. Defaults to False.
+        stream (bool, optional): option to write in constant-memory streaming mode. Defaults to False.
+        chunksize (int, optional): number of rows converted at a time when streaming. Defaults to 10_000.
+
+    Raises:
+        ValueError: If the number of sheet names does not match the number of dataframes.
     """
+    from pandas import ExcelWriter
+
+    sheets = _excel_sheets(df, sheetnames)
+    if stream:
+        _stream_excel(save_as, sheets, index, chunksize)
+        return
+
     with ExcelWriter(save_as) as writer:
-        if isinstance(sheetnames, List[DataFrame]):
-            for data, sheetnames in zip(df, sheetnames):
-                data.to_excel(writer, sheet_name=sheetnames, index=index, **kwargs)
-        else:
-            df.to_excel(writer, sheet_name=sheetnames, index=index, **kwargs)
+        for sheetname, data in sheets:
+            data.to_excel(writer, sheet_name=sheetname, index=index, **kwargs)
+
+
+def _to_excel_job(job: Tuple[str, Any, Dict[str, Any]] = None) -> str:
+    save_as, df, kwargs = job
+    to_excel(save_as, df, **kwargs)
+    return save_as
+
+
+def to_excel_parallel(
+    workbooks: Dict[str, DataFrame | List[DataFrame] | Dict[str, DataFrame]] = None,
+    max_workers: int = None,
+    **kwargs,
+) -> List[str]:
+    """
+    Writes several Excel workbooks at once, one per worker process. Sheets of a single workbook are written sequentially (the `.xlsx` container cannot be assembled in parallel), so split large exports into several workbooks to use all cores.
+
+    Args:
+        workbooks (Dict[str, ...], optional): mapping of file names to the dataframe(s) for each workbook (anything `to_excel` accepts as `df`). Defaults to None.
+        max_workers (int, optional): number of worker processes. Defaults to None (number of CPUs).
+        kwargs: passed to `to_excel` for every workbook (e.g., `stream=True`).
+
+    Returns:
+        List[str]: names of the written files
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [(save_as, df, kwargs) for save_as, df in workbooks.items()]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_to_excel_job, jobs))
 
 
 def to_txt(
@@ -67,39 +483,196 @@ def to_txt(
     **kwargs,
 ):
     """
-    Writes string or list of strings to a text file.
+    Writes string or list of strings to a text file. For repeated (e.g., per-record) appends, use a long-lived `TxtWriter` instead.
 
     Args:
         save_as (str, optional): name to save file as. Defaults to None.
         lines (Union[str, List[str]], optional): string or list of strings to save to file. Defaults to None.
         mode (literal, optional): write mode for ExcelWriter. Defaults to 'w'.
+        kwargs: passed to `open`, plus `compression` (inferred from the extension by default, see `_open_file`).
     """
 
-    with open(save_as, mode=mode, **kwargs) as file:
-        if isinstance(lines, str):
+    with _open_file(save_as, mode, **kwargs) as file:
+        if isinstance(lines, (str, bytes)):
             file.write(lines)
         else:
-            for line in lines:
-                file.write(line)
-        file.close()
+            file.writelines(lines)
+
+
+class TxtWriter:
+    """
+    Long-lived, buffered text writer for append-heavy code.
+
+    Lines are collected in memory and written with a single `writelines` call once `buffer_size` lines are pending, when `flush_interval` seconds have passed (from a background thread), or when the writer is flushed/closed. With `fsync` set, every flushed batch is synced to disk once (group commit) instead of once per line. Writing is thread-safe, and writers are not blocked while a batch is being synced.
+
+    Attributes:
+        save_as (str): Path of the file being written.
+        buffer_size (int): Number of pending lines that triggers a flush.
+        flush_interval (float | None): Seconds between background flushes.
+        fsync (bool): Sync every flushed batch to disk.
+
+    Args:
+        save_as (str=None): Path of the file to write.
+        mode (Literal["a", "w", "ab", "wb"]="a"): File mode.
+        buffer_size (int=1000): Number of pending lines that triggers a flush.
+        flush_interval (float=None): Seconds between background flushes, disabled when None.
+        fsync (bool=False): Sync every flushed batch to disk.
+        kwargs: Passed to `open`, plus `compression` (inferred from the extension by default, see `_open_file`).
+
+    Example:
+        >>> with TxtWriter("events.log", flush_interval=1.0) as writer:
+        >>>     for event in events:
+        >>>         writer.write(f"{event}\\n")
+    """
+
+    def __init__(
+        self,
+        save_as: str = None,
+        mode: Literal["a", "w", "ab", "wb"] = "a",
+        buffer_size: int = 1000,
+        flush_interval: float = None,
+        fsync: bool = False,
+        **kwargs,
+    ) -> None:
+        self.save_as = save_as
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+
+        self._file = _open_file(save_as, mode, **kwargs)
+        self._buffer = []
+        self._buffer_lock = threading.Lock()  # guards `_buffer`
+        self._io_lock = threading.Lock()  # keeps batches in order on disk
+        self._stop = threading.Event()
+        self._thread = None
+
+        if flush_interval:
+            self._thread = threading.Thread(
+                target=self._flush_periodically, daemon=True
+            )
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, lines: str | Iterable[str] = None) -> None:
+        """
+        Queues a line (or an iterable of lines), flushing once `buffer_size` lines are pending.
+
+        Raises:
+            ValueError: If the writer has been closed.
+        """
+        with self._buffer_lock:
+            if self._stop.is_set():  # set by `close` before its final flush
+                raise ValueError("I/O operation on closed file")
+            if isinstance(lines, (str, bytes)):
+                self._buffer.append(lines)
+            else:
+                self._buffer.extend(lines)
+            full = len(self._buffer) >= self.buffer_size
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all pending lines in one batch (and syncs them to disk if `fsync` is set)."""
+        with self._io_lock:
+            with self._buffer_lock:
+                batch, self._buffer = self._buffer, []
+            if not batch or self._file.closed:
+                return
+            self._file.writelines(batch)
+            self._file.flush()
+            if self.fsync and hasattr(self._file, "fileno"):
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Stops the background flusher, flushes pending lines, and closes the file."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+        self._file.close()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+
+def _write_json_array(file: Any = None, records: Iterable = None, **kwargs) -> int:
+    """Writes `records` to `file` as a top-level JSON array, one record at a time. Returns the record count."""
+    count = 0
+    file.write("[")
+    for count, record in enumerate(records, start=1):
+        if count > 1:
+            file.write(",\n")
+        json.dump(record, file, **kwargs)
+    file.write("]")
+    return count
 
 
 def to_json(
     save_as: str = None,
-    dict_to_save: Dict = None,
-    mode: Literal["w", "wb"] = "w",
+    dict_to_save: Dict | Iterable[Any] = None,
+    mode: Literal["w", "a"] = "w",
+    lines: bool = None,
+    compression: str | Dict | None = "infer",
     **kwargs,
 ):
     """
-    Writes a dictionary to a JSON file
+    Writes a dictionary (or any other JSON-serializable value) to a JSON file. An iterator of records (e.g., a generator) is written incrementally, as it is produced, either as a top-level JSON array or as JSON Lines.
 
     Args:
         save_as (str, optional): name to save file as. Defaults to None.
-        dict_to_save (Dict, optional): dictionary you want to write to the JSON file. Defaults to None.
+        dict_to_save (Dict | Iterable, optional): dictionary (or iterator of records) you want to write to the JSON file. Defaults to None.
         mode (literal, optional): writing mode. Defaults to 'w'.
+        lines (bool, optional): write records as JSON Lines, inferred from a `.jsonl`/`.ndjson` extension when None. Defaults to None.
+        compression (str | Dict | None, optional): compression method or settings (see `_open_file`). Defaults to "infer".
     """
-    with open(save_as, mode) as file:
-        json.dump(dict_to_save, file, **kwargs)
+    if lines is None:
+        lines = _strip_compression(save_as).endswith(_JSONL_EXTENSIONS)
+    if lines:
+        to_jsonl(save_as, dict_to_save, mode, compression, **kwargs)
+        return
+
+    with _open_file(save_as, mode, compression) as file:
+        if isinstance(dict_to_save, Iterator):
+            _write_json_array(file, dict_to_save, **kwargs)
+        else:
+            json.dump(dict_to_save, file, **kwargs)
+
+
+def to_jsonl(
+    save_as: str = None,
+    records: Iterable[Any] = None,
+    mode: Literal["w", "a"] = "w",
+    compression: str | Dict | None = "infer",
+    **kwargs,
+) -> int:
+    """
+    Writes records to a JSON Lines file (one JSON document per line) as they are produced, so only one record is held in memory at a time.
+
+    Args:
+        save_as (str, optional): name to save file as. Defaults to None.
+        records (Iterable, optional): records (e.g., dictionaries) you want to write. Defaults to None.
+        mode (literal, optional): writing mode, use 'a' to append records. Defaults to 'w'.
+        compression (str | Dict | None, optional): compression method or settings (see `_open_file`). Defaults to "infer".
+
+    Returns:
+        int: number of records written
+    """
+    count = 0
+    with _open_file(save_as, mode, compression) as file:
+        for count, record in enumerate(records, start=1):
+            file.write(json.dumps(record, **kwargs))
+            file.write("\n")
+    return count
 
 
 def df_to_json(
@@ -107,223 +680,2083 @@ def df_to_json(
     save_as: str = None,
     mode: Literal["w", "wb"] = "w",
     cfg={"orient": "dict", "into": type(dict), "index": True},
+    lines: bool = None,
+    chunksize: int = None,
+    compression: str | Dict | None = "infer",
 ):
     """
     Saves a Pandas DataFrame into a JSON file.
 
+    Notes:
+    - With `lines` or `chunksize` set, rows are serialized as records in chunks of `chunksize` rows (through Pandas' own JSON encoder) and written as they are produced; `cfg` is ignored in that case.
+
     Args:
         data (DataFrame): DataFrame you are saving. Default to None.
         save_as (string): Name of JSON file you are saving to. Default to None.
         mode (Literal["w", "wb"]): Mode you are saving the DataFrame with. Default to "w".
         cfg (Dict): Configuration dictionary for DataFrame -> Dictionary conversion. Default to None.
+        lines (bool): Write rows as JSON Lines, inferred from a `.jsonl`/`.ndjson` extension when None. Default to None.
+        chunksize (int): Number of rows serialized at a time when streaming records. Default to None.
+        compression (str | Dict | None): Compression method or settings (see `_open_file`). Default to "infer".
     """
-    data = data.to_dict(**cfg)
-    with open(save_as, mode) as file:
-        json.dump(data, file)
+    if lines is None:
+        lines = _strip_compression(save_as).endswith(_JSONL_EXTENSIONS)
+    if not (lines or chunksize):
+        data = data.to_dict(**cfg)
+        with _open_file(save_as, mode.replace("b", ""), compression) as file:
+            json.dump(data, file)
+        return
+
+    chunksize = chunksize or 100_000
+    with _open_file(save_as, mode.replace("b", ""), compression) as file:
+        file.write("" if lines else "[")
+        for start in range(0, data.shape[0], chunksize):
+            chunk = data.iloc[start : start + chunksize]
+            if lines:
+                text = chunk.to_json(orient="records", lines=True)
+                file.write(text if text.endswith("\n") else text + "\n")
+            else:
+                file.write("," if start else "")
+                file.write(chunk.to_json(orient="records")[1:-1])
+        file.write("" if lines else "]")
+
+
+def _npy_columns(
+    data: DataFrame = None, save_as: str = None, prefix: str = ""
+) -> List[Dict[str, Any]]:
+    """Saves each column of `data` as its own `.npy` file in `save_as`, returning the header entries."""
+    import numpy as np
+
+    entries = []
+    for number, (name, column) in enumerate(data.items()):
+        entry = {"name": name, "file": f"{prefix}{number}.npy"}
+        if column.dtype.name == "category":
+            entry["categories"] = f"{prefix}{number}.categories.npy"
+            np.save(
+                os.path.join(save_as, entry["categories"]),
+                np.asarray(column.cat.categories),
+                allow_pickle=True,
+            )
+            values = column.cat.codes.to_numpy()
+        else:
+            values = column.to_numpy()
+        entry["mmap"] = not values.dtype.hasobject
+        np.save(os.path.join(save_as, entry["file"]), values, allow_pickle=True)
+        entries.append(entry)
+    return entries
+
+
+def to_cache(
+    data: DataFrame = None,
+    save_as: str = None,
+    format: Literal["auto", "feather", "parquet", "npy"] = "auto",
+    compression: str = None,
+) -> str:
+    """
+    Saves a DataFrame in a binary columnar format that reloads (see `read_cache`) much faster than text or Excel files.
+
+    Notes:
+    - `"feather"` and `"parquet"` require `pyarrow`; Feather files are written uncompressed by default so they can be memory-mapped.
+    - `"npy"` needs only NumPy: `save_as` becomes a directory holding a `header.json` and one `.npy` file per column. Numeric, boolean, and datetime columns are memory-mappable; object columns are pickled inside their `.npy` file, so only load caches you wrote yourself.
+    - `"auto"` picks the format from the extension (`.feather`/`.arrow`, `.parquet`), otherwise Feather when `pyarrow` is installed and `"npy"` when it is not.
+
+    Args:
+        data (DataFrame, optional): DataFrame you are saving. Defaults to None.
+        save_as (str, optional): file (or, for `"npy"`, directory) name to save as. Defaults to None.
+        format (Literal["auto", "feather", "parquet", "npy"], optional): cache format. Defaults to "auto".
+        compression (str, optional): compression codec for Feather/Parquet. Defaults to None.
+
+    Returns:
+        str: format the cache was written in
+    """
+    from pandas import RangeIndex
+
+    if format == "auto":
+        format = _cache_format(save_as)
+
+    if format in ("feather", "parquet"):
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(data)
+        if format == "feather":
+            from pyarrow import feather
+
+            feather.write_feather(
+                table, save_as, compression=compression or "uncompressed"
+            )
+        else:
+            from pyarrow import parquet
+
+            parquet.write_table(table, save_as, compression=compression or "snappy")
+        return format
+
+    os.makedirs(save_as, exist_ok=True)
+    header = {"columns": _npy_columns(data, save_as), "index": None}
+    if isinstance(data.index, RangeIndex):
+        index = data.index
+        header["range_index"] = [index.start, index.stop, index.step, index.name]
+    else:
+        index = data.index.to_frame(index=False, name=range(data.index.nlevels))
+        header["index"] = _npy_columns(index, save_as, prefix="index_")
+        header["index_names"] = list(data.index.names)
+    with open(os.path.join(save_as, "header.json"), "w") as file:
+        json.dump(header, file, default=str)
+    return format
+
+
+def _cache_format(filename: str = None) -> str:
+    """Infers the cache format from a path (and whether `pyarrow` is installed)."""
+    if os.path.isdir(filename):
+        return "npy"
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in (".feather", ".arrow"):
+        return "feather"
+    if extension in (".parquet", ".pq"):
+        return "parquet"
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "npy"
+    return "feather"
+
+
+def _load_npy_columns(
+    directory: str = None, entries: List[Dict[str, Any]] = None, mmap: bool = True
+) -> Dict[str, Any]:
+    import numpy as np
+    from pandas import Categorical
+
+    columns = {}
+    for entry in entries:
+        path = os.path.join(directory, entry["file"])
+        mmap_mode = "c" if mmap and entry["mmap"] else None
+        # plain ndarray view of the mapping (no copy, no `np.memmap` subclass)
+        values = np.load(path, mmap_mode=mmap_mode, allow_pickle=True).view(np.ndarray)
+        if "categories" in entry:
+            categories = np.load(
+                os.path.join(directory, entry["categories"]), allow_pickle=True
+            )
+            values = Categorical.from_codes(values, categories)
+        columns[entry["name"]] = values
+    return columns
+
+
+def read_cache(
+    filename: str = None, columns: Sequence[str] = None, mmap: bool = True
+) -> DataFrame:
+    """
+    Loads a DataFrame saved with `to_cache`. Only the requested `columns` are read, and with `mmap` set, data is memory-mapped (copy-on-write for `"npy"` caches) instead of read into memory, so numeric columns are not copied where Pandas/Arrow allow it.
+
+    Args:
+        filename (str, optional): cache file (or `"npy"` cache directory) to load. Defaults to None.
+        columns (Sequence[str], optional): columns to load, all when None. Defaults to None.
+        mmap (bool, optional): memory-map the data instead of reading it. Defaults to True.
+
+    Returns:
+        DataFrame: loaded DataFrame
+    """
+    from pandas import DataFrame, RangeIndex
+
+    format = _cache_format(filename)
+    if format == "feather":
+        from pyarrow import feather
+
+        table = feather.read_table(filename, columns=columns, memory_map=mmap)
+        return table.to_pandas(split_blocks=True)
+    if format == "parquet":
+        from pyarrow import parquet
+
+        table = parquet.read_table(filename, columns=columns, memory_map=mmap)
+        return table.to_pandas(split_blocks=True)
+
+    with open(os.path.join(filename, "header.json")) as file:
+        header = json.load(file)
+    entries = header["columns"]
+    if columns is not None:
+        entries = [entry for entry in entries if entry["name"] in set(columns)]
+    data = DataFrame(_load_npy_columns(filename, entries, mmap), copy=False)
+    if header["index"] is None:
+        start, stop, step, name = header["range_index"]
+        data.index = RangeIndex(start, stop, step, name=name)
+    else:
+        index = DataFrame(
+            _load_npy_columns(filename, header["index"], mmap), copy=False
+        )
+        data.index = index.set_index(list(index.columns)).index
+        data.index.names = header["index_names"]
+    return data[list(columns)] if columns is not None else data
+
+
+class FileCache:
+    """
+    In-process LRU cache of parsed file contents, keyed by (path, modification time, size).
+
+    A cached value is returned only while the file's modification time and size are unchanged, so edits are picked up automatically at the cost of one `os.stat` per lookup. Entries are evicted (least recently used first) once their combined file sizes exceed `max_bytes`. Cached values are shared between callers, so treat them as read-only.
+
+    Attributes:
+        max_bytes (int): Upper bound on the combined size (in bytes) of the cached files.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to (re-)load the file.
+
+    Args:
+        max_bytes (int=64 * 1024**2): Upper bound on the combined size of the cached files.
+
+    Example:
+        >>> config = file_cache.get("config.json", read_json)
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024**2) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def get(
+        self, filename: str = None, loader: Callable = None, key: Hashable = None
+    ) -> Any:
+        """
+        Returns `loader(filename)`, reusing the cached result while the file is unchanged.
+
+        Args:
+            filename (str, optional): File to load. Defaults to None.
+            loader (Callable, optional): Function that parses the file. Defaults to None.
+            key (Hashable, optional): Distinguishes different parses of the same file (e.g., reading options). Defaults to None.
+
+        Returns:
+            Any: Parsed file contents.
+        """
+        stat = os.stat(filename)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cache_key = (os.path.abspath(filename), key)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader(filename)
+        with self._lock:
+            self._discard(cache_key)
+            if stat.st_size <= self.max_bytes:
+                self._entries[cache_key] = (signature, value)
+                self._bytes += stat.st_size
+            while self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+        return value
+
+    def invalidate(self, filename: str = None) -> None:
+        """Drops the cached entries of `filename`, or of every file when None."""
+        with self._lock:
+            if filename is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            path = os.path.abspath(filename)
+            for cache_key in [key for key in self._entries if key[0] == path]:
+                self._discard(cache_key)
+
+    def _discard(self, cache_key: Tuple[str, Hashable] = None) -> None:
+        entry = self._entries.pop(cache_key, None)
+        if entry is not None:
+            self._bytes -= entry[0][1]
+
+
+file_cache = FileCache()
+"""Shared cache used by `read_txt`, `read_json`, and `ParseConfig` when called with `cache=True`."""
+
+
+def iter_txt(
+    filename: str = None,
+    mode: Literal["r", "rb"] = "r",
+    batch_size: int = None,
+    offset: int = 0,
+    use_mmap: bool = None,
+    encoding: str = "utf-8",
+    errors: str = "strict",
+    compression: str | Dict | None = "infer",
+) -> Iterator[str | bytes] | Iterator[List[str | bytes]]:
+    """
+    Lazily reads a text file line by line (or in batches of lines), so peak memory stays flat regardless of the file size.
+
+    Notes:
+    - Line endings are preserved exactly as stored in the file (no newline translation).
+    - `offset` is a byte offset and should point at the start of a line.
+    - Files of at least `_MMAP_THRESHOLD` bytes are memory-mapped unless `use_mmap` says otherwise. Compressed files are never memory-mapped; they are decompressed on the fly and `offset` refers to the decompressed data.
+
+    Args:
+        filename (str, optional): file name to read. Defaults to None.
+        mode (literal, optional): reading mode, `"rb"` yields `bytes`. Defaults to 'r'.
+        batch_size (int, optional): yield lists of up to `batch_size` lines instead of single lines. Defaults to None.
+        offset (int, optional): byte offset to start reading from. Defaults to 0.
+        use_mmap (bool, optional): force (or disable) the memory-mapped reader. Defaults to None (decided by file size).
+        encoding (str, optional): text encoding used in text mode. Defaults to 'utf-8'.
+        errors (str, optional): decoding error handler used in text mode. Defaults to 'strict'.
+        compression (str | Dict | None, optional): compression method or settings (see `_open_file`). Defaults to "infer".
+
+    Returns:
+        Iterator: lines (or lists of lines) read from the file
+    """
+    binary = "b" in mode
+    compression = _detect_compression(filename, "r", compression)
+    if compression:
+        use_mmap = False
+    elif use_mmap is None:
+        use_mmap = os.path.getsize(filename) >= _MMAP_THRESHOLD
+
+    if use_mmap:
+        lines = _mmap_lines(filename, offset)
+        if not binary:
+            lines = (line.decode(encoding, errors) for line in lines)
+    else:
+        lines = _file_lines(filename, binary, offset, encoding, errors, compression)
+
+    return _batched(lines, batch_size) if batch_size else lines
 
 
 def read_txt(
-    filename: str = None, mode: Literal["r", "rb"] = "r", **kwargs
-) -> List[str]:
+    filename: str = None,
+    mode: Literal["r", "rb"] = "r",
+    stream: bool = False,
+    cache: bool = False,
+    **kwargs,
+) -> List[str] | Iterator[str]:
     """
     Reads text file. Returns None if path does not exist.
 
     Args:
         filename (str, optional): file name to read. Defaults to None.
         mode (literal, optional): reading mode. Defaults to 'r'.
+        stream (bool, optional): lazily yield lines through `iter_txt` (which receives `**kwargs`) instead of reading the whole file. Defaults to False.
+        cache (bool, optional): reuse the lines from `file_cache` while the file is unchanged (ignored when streaming). Defaults to False.
+        kwargs: passed to `open`, plus `compression` (inferred by default, see `_open_file`).
+
+    Returns:
+        list: returns list of strings of line read (or an iterator of lines when `stream` is set)
+    """
+    if not os.path.exists(filename):
+        return None
+    if stream:
+        return iter_txt(filename, mode, **kwargs)
+    if cache:
+        options = (mode, repr(sorted(kwargs.items())))
+        return file_cache.get(
+            filename, lambda path: read_txt(path, mode, **kwargs), ("txt", options)
+        )
+    with _open_file(filename, mode, **kwargs) as file:
+        return file.readlines()
+
+
+def iter_jsonl(
+    filename: str = None, batch_size: int = None, offset: int = 0, **kwargs
+) -> Iterator[Any] | Iterator[List[Any]]:
+    """
+    Lazily reads a JSON Lines file, yielding one decoded record (or a list of up to `batch_size` records) at a time. Blank lines are skipped.
+
+    Args:
+        filename (str, optional): name of JSON Lines file to read. Defaults to None.
+        batch_size (int, optional): yield lists of up to `batch_size` records instead of single records. Defaults to None.
+        offset (int, optional): byte offset (of a line start) to start reading from. Defaults to 0.
+
+    Returns:
+        Iterator: decoded records (or lists of records)
+    """
+    lines = iter_txt(filename, "rb", offset=offset, **kwargs)
+    records = (json.loads(line) for line in lines if line.strip())
+    return _batched(records, batch_size) if batch_size else records
+
+
+def iter_json_array(
+    filename: str = None,
+    batch_size: int = None,
+    chunk_size: int = 1024**2,
+    encoding: str = "utf-8",
+    compression: str | Dict | None = "infer",
+) -> Iterator[Any] | Iterator[List[Any]]:
+    """
+    Incrementally parses a JSON file whose top-level value is an array, yielding one element (or a list of up to `batch_size` elements) at a time. Only `chunk_size` characters plus the element being decoded are held in memory.
+
+    Args:
+        filename (str, optional): name of JSON file to read. Defaults to None.
+        batch_size (int, optional): yield lists of up to `batch_size` elements instead of single elements. Defaults to None.
+        chunk_size (int, optional): number of characters read from the file at a time. Defaults to 1024**2.
+        encoding (str, optional): text encoding of the file. Defaults to 'utf-8'.
+        compression (str | Dict | None, optional): compression method or settings (see `_open_file`). Defaults to "infer".
+
+    Raises:
+        ValueError: If the top-level value is not an array, or the file is truncated/malformed.
 
     Returns:
-        list: returns list of strings of line read
+        Iterator: decoded array elements (or lists of elements)
     """
-    with open(filename, mode=mode, **kwargs) as file:
-        return file.readlines() if os.path.exists(filename) else None
+    records = _iter_json_array(filename, chunk_size, encoding, compression)
+    return _batched(records, batch_size) if batch_size else records
+
+
+def _iter_json_array(
+    filename: str = None,
+    chunk_size: int = 1024**2,
+    encoding: str = "utf-8",
+    compression: str | Dict | None = "infer",
+) -> Iterator[Any]:
+    """Generator behind `iter_json_array`."""
+    decoder = json.JSONDecoder()
+    with _open_file(filename, "r", compression, encoding=encoding) as file:
+        buffer, pos, eof, started = "", 0, False, False
+        while True:
+            # skip whitespace (and separators) between values
+            pos = _JSON_SEPARATORS.match(buffer, pos).end()
+            if pos == len(buffer) and not eof:
+                buffer, pos = file.read(chunk_size), 0
+                eof = not buffer
+                continue
+            if not started:
+                if pos == len(buffer) or buffer[pos] != "[":
+                    raise ValueError(
+                        f"'{filename}' does not contain a top-level JSON array"
+                    )
+                started, pos = True, pos + 1
+                continue
+            if pos == len(buffer):
+                raise ValueError(f"Unexpected end of file while parsing '{filename}'")
+            if buffer[pos] == "]":
+                return
+            try:
+                record, end = decoder.raw_decode(buffer, pos)
+                after = _JSON_WHITESPACE.match(buffer, end).end()
+            except json.JSONDecodeError:
+                end = after = None
+            # a value is only complete once the next token ("," or "]") is in the
+            # buffer, otherwise it may be truncated (e.g., "1." out of "1.5")
+            if end is None or after == len(buffer) or buffer[after] not in ",]":
+                if eof:
+                    raise ValueError(f"Malformed JSON array in '{filename}'")
+                more = file.read(chunk_size)
+                buffer, pos, eof = buffer[pos:] + more, 0, not more
+                continue
+            yield record
+            pos = end
 
 
 def read_json(
-    filename: str = None, sort_key: Any = None, *args, **kwargs
-) -> Dict[Any, Any]:
+    filename: str = None,
+    sort_key: Any = None,
+    *args,
+    lines: bool = None,
+    stream: bool = False,
+    batch_size: int = None,
+    records: int | slice | Sequence[int] = None,
+    sample: int = None,
+    seed: int = None,
+    index_every: int = None,
+    compression: str | Dict | None = "infer",
+    cache: bool = False,
+    **kwargs,
+) -> Dict[Any, Any] | List[Any] | Iterator[Any]:
     """
     Reads JSON file. Returns None if path does not exist.
 
+    Notes:
+    - With `stream` set, records are yielded lazily (see `iter_jsonl` and `iter_json_array`); the file must then be JSON Lines or hold a top-level array, and `sort_key` cannot be used.
+    - `records` and `sample` fetch records of a JSON Lines file by seeking through its sidecar `JSONLIndex` (built on first use) instead of parsing the whole file.
+    - Compressed files are decompressed on the fly (see `_open_file`).
+
     Args:
         filename (str, optional): name of JSON file to read. Defaults to None.
+        sort_key (Any, optional): key function to sort the read data with. Defaults to None.
+        lines (bool, optional): read the file as JSON Lines, inferred from a `.jsonl`/`.ndjson` extension when None. Defaults to None.
+        stream (bool, optional): lazily yield records instead of decoding the whole file. Defaults to False.
+        batch_size (int, optional): yield lists of up to `batch_size` records when streaming. Defaults to None.
+        records (int | slice | Sequence[int], optional): position, slice, or positions of the JSON Lines records to fetch. Defaults to None.
+        sample (int, optional): number of JSON Lines records to fetch at random. Defaults to None.
+        seed (int, optional): random seed used with `sample`. Defaults to None.
+        index_every (int, optional): interval between offsets stored in the `JSONLIndex` used with `records`/`sample`; reuses that of the existing sidecar (or 1 without one) when None. Defaults to None.
+        compression (str | Dict | None, optional): compression method or settings (see `_open_file`). Defaults to "infer".
+        cache (bool, optional): reuse the decoded data from `file_cache` while the file is unchanged (ignored when streaming or fetching `records`/`sample`). Defaults to False.
+
+    Raises:
+        ValueError: If `sort_key` is combined with `stream`.
+        ValueError: If `records` or `sample` is used on a file that is not JSON Lines.
+        TypeError: If `args` (positional `open` arguments after `mode`) do not fit `open`.
 
     Returns:
-        dictionary: returns read JSON data
+        dictionary: returns read JSON data (or an iterator of records when `stream` is set)
     """
-    with open(filename, *args, **kwargs) as f:
-        data = json.load(f) if os.path.exists(filename) else None
+    if not os.path.exists(filename):
+        return None
+    if lines is None:
+        lines = _strip_compression(filename).endswith(_JSONL_EXTENSIONS)
+
+    if records is not None or sample is not None:
+        if not lines:
+            raise ValueError("'records' and 'sample' require a JSON Lines file")
+        index = JSONLIndex(filename, index_every, compression)
+        if sample is not None:
+            return index.sample(sample, seed)
+        if isinstance(records, (int, slice)):
+            return index[records]
+        return index.take(records)
+
+    if stream:
         if sort_key:
-            return sorted(data, key=sort_key)
-        else:
-            return data
+            raise ValueError("'sort_key' cannot be combined with 'stream'")
+        if lines:
+            return iter_jsonl(filename, batch_size, compression=compression)
+        return iter_json_array(filename, batch_size, compression=compression)
+
+    if cache:
+        options = (
+            sort_key,
+            lines,
+            args,
+            repr(compression),
+            repr(sorted(kwargs.items())),
+        )
+        return file_cache.get(
+            filename,
+            lambda path: read_json(
+                path, sort_key, *args, lines=lines, compression=compression, **kwargs
+            ),
+            ("json", options),
+        )
+
+    if lines:
+        data = list(iter_jsonl(filename, compression=compression))
+    else:
+        with _open_file(
+            filename, compression=compression, **_open_arguments(args, kwargs)
+        ) as f:
+            data = json.load(f)
+    return sorted(data, key=sort_key) if sort_key else data
+
+
+_SIDECAR_EXTENSION = ".idx"
+"""Suffix of the sidecar index files saved next to indexed data files (see `JSONLIndex` and `ArchiveReader`)."""
+
+
+def _read_sidecar(
+    path: str = None, signature: Dict[str, Any] = None, payload: bool = True
+) -> Tuple[Dict[str, Any], bytes] | None:
+    """
+    Reads a sidecar index: its JSON header line and (with `payload`) the bytes after it. Returns None if it is missing, unreadable, or its header doesn't match `signature`.
+    """
+    try:
+        with open(path, "rb") as file:
+            header = json.loads(file.readline())
+            if not isinstance(header, dict) or any(
+                header.get(key) != value for key, value in (signature or {}).items()
+            ):
+                return None
+            return header, file.read() if payload else b""
+    except (OSError, ValueError):
+        return None
+
+
+def _write_sidecar(
+    path: str = None, header: Dict[str, Any] = None, payload: bytes = b""
+) -> bool:
+    """
+    Atomically writes a sidecar index (JSON header line, then `payload`). Returns False, leaving no partial file behind, if it can't be written (e.g., in a read-only directory).
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(json.dumps(header).encode() + b"\n")
+            file.write(payload)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+    return True
+
+
+class JSONLIndex:
+    """
+    Sidecar byte-offset index for random access into a JSON Lines file.
+
+    The (decompressed) byte offset of every `every`-th record is saved next to the data (as `<filename>.idx`) together with the file's size and modification time; the index is rebuilt automatically when either of those change, and only kept in memory when the sidecar can't be written (e.g., in a read-only directory). Records are then fetched by seeking instead of parsing the file from the start. Blank lines are not counted as records. Compressed files can be indexed too, but seeking in them still decompresses up to the requested offset.
+
+    Attributes:
+        filename (str): Path to the JSON Lines file.
+        index_path (str): Path to the sidecar index file.
+        every (int): Interval (in records) between stored offsets; larger values give smaller indexes but more lines to skip per lookup.
+        count (int): Number of records in the file.
+        offsets (array): Stored byte offsets.
+
+    Args:
+        filename (str=None): Path to the JSON Lines file.
+        every (int=None): Interval (in records) between stored offsets; reuses that of the existing sidecar (or 1 without one) when None.
+        compression (str | Dict | None="infer"): Compression method or settings of the data file (see `_open_file`).
+    """
+
+    extension = _SIDECAR_EXTENSION
+
+    def __init__(
+        self,
+        filename: str = None,
+        every: int = None,
+        compression: str | Dict | None = "infer",
+    ) -> None:
+        self.filename = filename
+        self.index_path = filename + self.extension
+        self.every = every or self._stored_every()
+        self.compression = compression
+        self.count = 0
+        self.offsets = array("q")
+
+        if not self.load():
+            self.build()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, key: int | slice) -> Any | List[Any]:
+        if isinstance(key, slice):
+            return list(self.records(key.start, key.stop, key.step))
+        return self.take([key])[0]
+
+    @property
+    def _signature(self) -> Dict[str, Any]:
+        stat = os.stat(self.filename)
+        return {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "every": self.every,
+            "byteorder": sys.byteorder,
+        }
+
+    def _stored_every(self) -> int:
+        """Interval of the sidecar index on disk, or 1 if there is none."""
+        sidecar = _read_sidecar(self.index_path, payload=False)
+        try:
+            return int(sidecar[0].get("every", 1)) if sidecar else 1
+        except (TypeError, ValueError):
+            return 1
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the sidecar index on disk matches the current state of the data file."""
+        return (
+            _read_sidecar(self.index_path, self._signature, payload=False) is not None
+        )
+
+    def load(self) -> bool:
+        """Loads the sidecar index. Returns False if it is missing or stale."""
+        sidecar = _read_sidecar(self.index_path, self._signature)
+        if sidecar is None:
+            return False
+        header, payload = sidecar
+        offsets = array("q")
+        offsets.frombytes(payload)
+        self.count, self.offsets = header["count"], offsets
+        return True
+
+    def build(self) -> None:
+        """Scans the data file once, recording the offset of every `every`-th record, and saves the index."""
+        signature = self._signature
+        offsets, count, position = array("q"), 0, 0
+        with _open_file(self.filename, "rb", self.compression) as file:
+            for line in file:
+                if line.strip():
+                    if count % self.every == 0:
+                        offsets.append(position)
+                    count += 1
+                position += len(line)
+        self.count, self.offsets = count, offsets
+        self.save(signature)
+
+    def save(self, signature: Dict[str, Any] = None) -> None:
+        """Atomically writes the index next to the data file (skipped if the directory isn't writable)."""
+        header = {**(signature or self._signature), "count": self.count}
+        _write_sidecar(self.index_path, header, self.offsets.tobytes())
+
+    def _normalize(self, index: int = None) -> int:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(f"Record {index} out of range for {self.count} records")
+        return index
+
+    def _read_at(self, file: Any = None, index: int = None) -> Any:
+        """Seeks to the closest stored offset and decodes record `index`."""
+        file.seek(self.offsets[index // self.every])
+        skip = index % self.every
+        for line in file:
+            if not line.strip():
+                continue
+            if not skip:
+                return json.loads(line)
+            skip -= 1
+
+    def take(self, indices: Iterable[int] = None) -> List[Any]:
+        """
+        Fetches records by position (negative positions count from the end), in the order requested.
+
+        Raises:
+            IndexError: If a position is out of range.
+        """
+        indices = [self._normalize(index) for index in indices]
+        records = {}
+        with _open_file(self.filename, "rb", self.compression) as file:
+            seekable = file.seekable()
+            for index in sorted(set(indices)):  # seek forward through the file
+                if seekable:
+                    records[index] = self._read_at(file, index)
+                else:  # forward-only streams (e.g., zstd) are re-read from the start
+                    records[index] = next(self.records(index, index + 1))
+        return [records[index] for index in indices]
+
+    def records(
+        self, start: int = None, stop: int = None, step: int = None
+    ) -> Iterator[Any]:
+        """Lazily yields the records of a slice, seeking once per record only when the step skips whole index blocks."""
+        start, stop, step = slice(start, stop, step).indices(self.count)
+        if step < 0 or step > self.every:
+            for indices in _batched(range(start, stop, step), 1024):
+                yield from self.take(indices)
+            return
+        if start >= stop:
+            return
+        block = start // self.every
+        records = iter_jsonl(
+            self.filename,
+            offset=self.offsets[block],
+            use_mmap=False,
+            compression=self.compression,
+        )
+        first = start - block * self.every
+        yield from islice(records, first, first + stop - start, step)
+
+    def sample(self, n: int = None, seed: int = None) -> List[Any]:
+        """Fetches `n` distinct records chosen uniformly at random (in file order)."""
+        chosen = random.Random(seed).sample(range(self.count), min(n, self.count))
+        return self.take(sorted(chosen))
+
+
+def _bucket_edges(n: int = None, buckets: int = None) -> np.ndarray:
+    """Start positions of `buckets` (nearly) equal, non-empty buckets over `n` items, followed by `n`."""
+    import numpy as np
+
+    return np.linspace(0, n, buckets + 1).astype(np.int64)
+
+
+def _sorted_unique(positions: np.ndarray = None) -> np.ndarray:
+    """Sorted, de-duplicated copy of an integer array (cheaper than `np.unique` for positions)."""
+    import numpy as np
+
+    positions = np.sort(positions)
+    return (
+        positions[np.r_[True, positions[1:] != positions[:-1]]]
+        if len(positions)
+        else positions
+    )
+
+
+def _first_per_bucket(mask: np.ndarray = None, edges: np.ndarray = None) -> np.ndarray:
+    """Position of the first `True` in every bucket (each bucket must contain one)."""
+    import numpy as np
+
+    hits = np.flatnonzero(mask)
+    return hits[np.searchsorted(hits, edges[:-1])]
+
+
+def _minmax_indices(y: np.ndarray = None, size: int = None) -> np.ndarray:
+    """Keeps the minimum and maximum of `size // 2` equal buckets."""
+    import numpy as np
+
+    edges = _bucket_edges(len(y), max(size // 2, 1))
+    counts = np.diff(edges)
+    filled = np.where(np.isnan(y), np.nanmean(y) if not np.isnan(y).all() else 0, y)
+    lows = np.repeat(np.minimum.reduceat(filled, edges[:-1]), counts)
+    highs = np.repeat(np.maximum.reduceat(filled, edges[:-1]), counts)
+    return _sorted_unique(
+        np.r_[
+            _first_per_bucket(filled == lows, edges),
+            _first_per_bucket(filled == highs, edges),
+        ]
+    )
+
+
+def _lttb_indices(
+    x: np.ndarray = None, y: np.ndarray = None, size: int = None
+) -> np.ndarray:
+    """
+    Largest-triangle-three-buckets selection, vectorized over all buckets.
+
+    The first and last points are always kept; every other bucket keeps the point forming the largest triangle with the neighbouring buckets. Unlike the sequential algorithm, the left vertex of each triangle is the previous bucket's centroid (rather than its selected point), which lets every bucket be processed at once. On noisy data the selected points can therefore differ from the sequential algorithm's, but each is still the most prominent point of its bucket.
+    """
+    import numpy as np
+
+    n = len(y)
+    y = np.nan_to_num(y, nan=np.nanmean(y) if not np.isnan(y).all() else 0.0)
+    inner_x, inner_y = x[1:-1], y[1:-1]
+    edges = _bucket_edges(n - 2, size - 2)
+    counts = np.diff(edges)
+    centroid_x = np.add.reduceat(inner_x, edges[:-1]) / counts
+    centroid_y = np.add.reduceat(inner_y, edges[:-1]) / counts
+
+    # left vertex: previous centroid (first point for the first bucket),
+    # right vertex: next centroid (last point for the last bucket)
+    left_x = np.repeat(np.r_[x[0], centroid_x[:-1]], counts)
+    left_y = np.repeat(np.r_[y[0], centroid_y[:-1]], counts)
+    right_x = np.repeat(np.r_[centroid_x[1:], x[-1]], counts)
+    right_y = np.repeat(np.r_[centroid_y[1:], y[-1]], counts)
+    areas = np.abs(
+        (left_x - right_x) * (inner_y - left_y)
+        - (left_x - inner_x) * (right_y - left_y)
+    )
+    largest = np.repeat(np.maximum.reduceat(areas, edges[:-1]), counts)
+    chosen = _first_per_bucket(areas == largest, edges) + 1
+    return np.r_[0, chosen, n - 1]
+
+
+def _reduction_indices(
+    data: DataFrame = None,
+    size: int = None,
+    method: str = "head",
+    x: str = None,
+    y: str = None,
+    by: str = None,
+    seed: int = None,
+) -> np.ndarray:
+    """Row positions kept by `reduce_df`."""
+    import numpy as np
+
+    n = data.shape[0]
+    if method == "head":
+        return np.arange(size)
+    if method == "stride":
+        return _sorted_unique(np.linspace(0, n - 1, size).round().astype(np.int64))
+    if method == "random":
+        return np.sort(np.random.default_rng(seed).choice(n, size, replace=False))
+    if method == "stratified":
+        if by is None:
+            raise ValueError("'by' is required for stratified reduction")
+        rng, fraction = np.random.default_rng(seed), size / n
+        positions = [
+            rng.choice(group, max(round(len(group) * fraction), 1), replace=False)
+            for group in data.groupby(by, sort=False).indices.values()
+        ]
+        return np.sort(np.concatenate(positions))
+    if method in ("minmax", "lttb"):
+        from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+        if y is None:
+            raise ValueError(f"'y' is required for '{method}' reduction")
+        if not is_numeric_dtype(data[y]):
+            _msg = f"Column '{y}' is not numeric, so '{method}' reduction can't use it; falling back to 'stride'"
+            warnings.warn(_msg, UserWarning, stacklevel=3)
+            return _reduction_indices(data, size, "stride")
+        values = data[y].to_numpy(dtype=np.float64, na_value=np.nan)
+        if method == "minmax":
+            return _minmax_indices(values, size)
+        if size < 3:
+            return np.array([0, n - 1])
+        if x is not None and is_datetime64_any_dtype(data[x]):  # as nanoseconds
+            positions = data[x].to_numpy(dtype="datetime64[ns]").astype(np.float64)
+        elif x is not None and is_numeric_dtype(data[x]):
+            positions = data[x].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:  # no x, or labels (strings, categories): use row positions
+            positions = np.arange(n, dtype=np.float64)
+        return _lttb_indices(positions, values, size)
+    _msg = f"Unknown reduction method '{method}'. Use one of {_REDUCTION_METHODS}"
+    raise ValueError(_msg)
 
 
 def reduce_df(
     data: DataFrame = None,
-    percent: float = None,
+    percent: float | RANGE = None,
     save_type: Literal["list", "tuple", "dataframe"] = None,
+    method: Literal[
+        "head", "stride", "random", "stratified", "minmax", "lttb"
+    ] = "head",
+    x: str = None,
+    y: str = None,
+    by: str = None,
+    seed: int = None,
 ) -> _reduced_types:
     """
     Reduces size of `pd.DataFrame` input based on decimal-representation of what percentage of the original dataset the returned data set should be. Orginial dataset will be returned if parameters are not correctly set (as a safeguard). User is warned if arguments are missing.
 
     Notes:
     - Your data can be returned as a list or tuple of the columns.
+    - Reduction methods (all vectorized with NumPy, rows keep their original order):
+        - `head`: first rows (drops the tail of the data).
+        - `stride`: evenly spaced rows over the whole dataset.
+        - `random`: uniformly sampled rows (reproducible with `seed`).
+        - `stratified`: random rows sampled from every group of column `by` in proportion to its size.
+        - `minmax`: minimum and maximum of column `y` in each of `percent * len(data) / 2` buckets, keeps peaks and troughs.
+        - `lttb`: largest-triangle-three-buckets on column `y` (against column `x`, or the row position), keeps the visual shape of a signal for plotting.
 
     Args:
         data (`DataFrame`): Original dataset, by default None
-        percent (float): Percentage of `data` that you want returned, by default None
+        percent (float | RANGE): Percentage of `data` that you want returned, by default None
         save_type (literal, optional): Return shortened `DataFrame` as a `tuple` or `list` of the columns, returns `new_df` if left `None` or `"dataframe"`.
+        method (literal, optional): Reduction method, by default "head"
+        x (str, optional): Column used as the horizontal axis by `lttb` (row positions are used if it is neither numeric nor datetime), by default None (row position)
+        y (str, optional): Numeric column whose shape is preserved by `minmax` and `lttb` (other columns fall back to `stride`, with a warning), by default None
+        by (str, optional): Column whose groups are preserved by `stratified`, by default None
+        seed (int, optional): Random seed for `random` and `stratified`, by default None
+
+    Raises:
+        ValueError: If `method` is unknown, or the column it requires is missing.
 
     Returns:
         DataFrame: Shortened `DataFrame` as a tuple or list of the columns, or left as a `DataFrame`.
     """
-    if not (data or percent):
+    percent = getattr(percent, "value", percent)
+    if data is None or not percent:
         _msg = "'data' and 'percent' must both me used. Original dataset will be returned if inputted, otherwise, None will be returned."
-        # warnings.warn(_msg, MissingArgumentsWarning)
-        return data if data and not percent else None
-    elif data and percent:
-        new_df = data.head(int(data.shape[0] * percent))
-        df_list = [new_df[col] for col in new_df.columns]
-        returns = {"list": df_list, "tuple": tuple(df_list), "dataframe": new_df}
-        return returns.get(save_type, new_df)
+        warnings.warn(_msg, MissingArgumentsWarning)
+        return data
 
+    size = int(data.shape[0] * percent)
+    if size >= data.shape[0]:
+        new_df = data
+    else:
+        new_df = data.iloc[_reduction_indices(data, size, method, x, y, by, seed)]
+    df_list = [new_df[col] for col in new_df.columns]
+    returns = {"list": df_list, "tuple": tuple(df_list), "dataframe": new_df}
+    return returns.get(save_type, new_df)
 
-def pull_columns(data: Any = None, *cols, as_tuple: bool = False) -> List | Tuple:
+
+def _column_block(arrays: List[np.ndarray]) -> np.ndarray | None:
+    """
+    Returns a 2-D view over same-dtype 1-D column arrays if they are evenly spaced in one buffer.
+
+    Args:
+        arrays (List[np.ndarray]): Column arrays (e.g., from ``Series.to_numpy()``).
+
+    Returns:
+        np.ndarray | None: A read-only ``(rows, columns)`` view, or None if the columns can't be expressed as one strided view.
+    """
+    import numpy as np
+
+    first = arrays[0]
+    if first.dtype.hasobject or any(
+        arr.dtype != first.dtype
+        or arr.shape != first.shape
+        or arr.strides != first.strides
+        for arr in arrays
+    ):
+        return None
+
+    roots = []
+    for arr in arrays:
+        while isinstance(arr.base, np.ndarray):
+            arr = arr.base
+        roots.append(arr)
+    if any(root is not roots[0] for root in roots):
+        return None
+
+    addresses = [arr.__array_interface__["data"][0] for arr in arrays]
+    step = addresses[1] - addresses[0] if len(arrays) > 1 else first.itemsize
+    if any(b - a != step for a, b in zip(addresses, addresses[1:])):
+        return None
+
+    return np.lib.stride_tricks.as_strided(
+        first,
+        shape=(first.shape[0], len(arrays)),
+        strides=(first.strides[0], step),
+        writeable=False,
+    )
+
+
+def pull_columns(
+    data: Any = None,
+    *cols,
+    as_tuple: bool = False,
+    layout: Literal["series", "array", "structured", "dict"] = "series",
+) -> List | Tuple | Dict[str, np.ndarray] | np.ndarray:
     """
     Method for pulling specific columns of dataframe, as list or tuple of said columns.
 
     Args:
         data (Any, optional): data to pull from (as a Pandas dataframe). Defaults to None.
-        tuple (bool, optional): option to return a tuple of pulled columns. Defaults to False.
+        as_tuple (bool, optional): option to return a tuple of pulled columns (only with ``layout="series"``). Defaults to False.
+        layout (Literal["series", "array", "structured", "dict"], optional): ``"series"`` returns the columns as Series, ``"array"`` a single 2-D NumPy array of shape ``(rows, columns)``, ``"structured"`` a NumPy structured array with one field per column, and ``"dict"`` a dictionary of NumPy column arrays. Defaults to "series".
+
+    Returns:
+        list, tuple, dict, or np.ndarray: returns targeted columns in the requested layout
+
+    Warns:
+        UnavoidableCopyWarning: if the requested layout could not be built without copying the data.
+
+    Notes:
+        - With ``layout="array"``, columns that share a dtype block and are evenly spaced within it (e.g., adjacent columns, or every other column) are returned as a read-only strided view of the dataframe's memory. Otherwise the columns are copied into one array.
+        - ``layout="dict"`` returns views for NumPy-backed columns. Extension dtypes (categorical, nullable integers, Arrow strings, etc.) have to be converted.
+        - ``layout="structured"`` always copies, since Pandas stores data column by column and a structured array stores it row by row.
+    """
+    if layout == "series":
+        pulled = (data[col] for col in cols)
+        return tuple(pulled) if as_tuple else list(pulled)
+
+    import numpy as np
+
+    if not cols:
+        cols = tuple(data.columns)
+    series = [data[col] for col in cols]
+    copied = [
+        str(col)
+        for col, ser in zip(cols, series)
+        if not isinstance(ser.dtype, np.dtype)
+    ]
+    arrays = [ser.to_numpy() for ser in series]
+
+    if layout == "dict":
+        result = dict(zip(cols, arrays))
+    elif layout == "array":
+        result = None if copied else _column_block(arrays)
+        if result is None:
+            result = np.empty(
+                (len(data), len(arrays)), dtype=np.result_type(*arrays), order="F"
+            )
+            for i, arr in enumerate(arrays):
+                result[:, i] = arr
+            copied = [str(col) for col in cols]
+    elif layout == "structured":
+        result = np.empty(
+            len(data), dtype=[(str(col), arr.dtype) for col, arr in zip(cols, arrays)]
+        )
+        for col, arr in zip(cols, arrays):
+            result[str(col)] = arr
+        copied = [str(col) for col in cols]
+    else:
+        _msg = f"Unknown layout '{layout}'; expected 'series', 'array', 'structured', or 'dict'"
+        raise ValueError(_msg)
+
+    if copied:
+        _msg = f"Columns {copied} had to be copied to build the '{layout}' layout"
+        warnings.warn(_msg, UnavoidableCopyWarning, stacklevel=2)
+
+    return result
+
+
+def _match_globs(
+    name: str = None, include: Sequence[str] = None, exclude: Sequence[str] = None
+) -> bool:
+    """Checks a (POSIX-style) archive member name, or its base name, against include and exclude glob patterns."""
+    candidates = (name, name.rsplit("/", 1)[-1])
+    if include and not any(
+        fnmatch(candidate, pattern) for pattern in include for candidate in candidates
+    ):
+        return False
+    return not (
+        exclude
+        and any(
+            fnmatch(candidate, pattern)
+            for pattern in exclude
+            for candidate in candidates
+        )
+    )
+
+
+def _archive_members(
+    to_zip: Sequence[str] | str = None,
+    include: Sequence[str] = None,
+    exclude: Sequence[str] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Lists the files to archive as `(path, arcname)` pairs.
+
+    A single directory is archived by its contents (member names relative to it), while directories inside a list keep their own name as the top-level folder. Files in a list are stored under the path they are given as.
+    """
+    if isinstance(to_zip, (str, os.PathLike)):
+        to_zip = [to_zip]
+        top_level = not os.path.isdir(to_zip[0])
+    else:
+        top_level = True
+
+    members = []
+    for entry in map(os.fspath, to_zip):
+        if not os.path.isdir(entry):
+            arcname = entry.replace(os.sep, "/")
+            if _match_globs(arcname, include, exclude):
+                members.append((entry, arcname))
+            continue
+
+        base = os.path.dirname(os.path.normpath(entry)) if top_level else entry
+        for root, dirs, files in os.walk(entry):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                arcname = os.path.relpath(path, base).replace(os.sep, "/")
+                if _match_globs(arcname, include, exclude):
+                    members.append((path, arcname))
+    return members
+
+
+def _deflate_member(job: Tuple[str, str, int, int]) -> Tuple[str, int, int, int]:
+    """
+    Compresses one file into a raw deflate stream in a temporary file. Worker for `zip_folder`.
 
     Returns:
-        list or tuple: returns targeted columns as a list or tuple
+        Tuple[str, int, int, int]: temporary file path, CRC-32, uncompressed size, and compressed size
+    """
+    path, tmp_dir, compresslevel, chunk_size = job
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    crc, file_size, compress_size = 0, 0, 0
+
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir, suffix=".deflate")
+    with open(path, "rb") as src, os.fdopen(fd, "wb") as dst:
+        while chunk := src.read(chunk_size):
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+            data = compressor.compress(chunk)
+            compress_size += len(data)
+            dst.write(data)
+        data = compressor.flush()
+        compress_size += len(data)
+        dst.write(data)
+    return tmp_path, crc, file_size, compress_size
+
+
+_ZIPFILE_INTERNALS = (
+    "fp",
+    "filelist",
+    "NameToInfo",
+    "start_dir",
+    "_allowZip64",
+    "_didModify",
+    "_lock",
+    "_seekable",
+    "_writecheck",
+    "_writing",
+)
+"""Private `ZipFile` attributes `_write_deflated_member` relies on (mirroring `ZipFile.open(..., "w")`)."""
+
+
+def _can_splice(zf: ZipFile = None) -> bool:
+    """
+    Whether precompressed members can be spliced into `zf` with `_write_deflated_member`.
+
+    Requires every attribute in `_ZIPFILE_INTERNALS` (so a CPython change falls back to `ZipFile.write` instead of writing corrupt archives), a seekable file, and no open write handle.
+    """
+    if not all(hasattr(zf, name) for name in _ZIPFILE_INTERNALS):
+        return False
+    return bool(zf._seekable) and not zf._writing and hasattr(ZipInfo, "FileHeader")
+
+
+def _write_deflated_member(
+    zf: ZipFile = None,
+    path: str = None,
+    arcname: str = None,
+    member: Tuple[str, int, int, int] = None,
+    chunk_size: int = _ARCHIVE_CHUNK_SIZE,
+) -> None:
     """
-    pulled = (data[col] for col in cols)
-    return pulled if as_tuple else list(pulled)
+    Appends a member compressed by `_deflate_member` to an open archive, without recompressing it.
+
+    Mirrors `ZipFile.open(..., "w")`, except that the CRC and sizes are known up front, so the local header is written once and the compressed stream is copied in as-is. Only call it on archives for which `_can_splice` is True.
+
+    Raises:
+        ValueError: If another write handle is open on the archive.
+        LargeZipFile: If the member needs ZIP64 extensions but they are disabled.
+    """
+    tmp_path, crc, file_size, compress_size = member
+    zinfo = ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = ZIP_DEFLATED
+    zinfo.flag_bits = 0x00
+    zinfo.CRC, zinfo.file_size, zinfo.compress_size = crc, file_size, compress_size
+    zip64 = max(file_size, compress_size) > ZIP64_LIMIT
+    if zip64 and not zf._allowZip64:
+        _msg = f"'{path}' would require ZIP64 extensions"
+        raise LargeZipFile(_msg)
+
+    with zf._lock:
+        if zf._writing:
+            _msg = "Can't splice a member while another write handle is open on the archive"
+            raise ValueError(_msg)
+        zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.fp.tell()
+        zf._writecheck(zinfo)
+        zf._didModify = True
+        zf.fp.write(zinfo.FileHeader(zip64))
+        with open(tmp_path, "rb") as src:
+            shutil.copyfileobj(src, zf.fp, chunk_size)
+        zf.start_dir = zf.fp.tell()
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
 
 
 def zip_folder(
     zipped_filename: str = None,
     to_zip: Sequence[str] | str = None,
     mode: Literal["w", "x", "a"] = "w",
-) -> None:
+    include: Sequence[str] = None,
+    exclude: Sequence[str] = None,
+    store_extensions: Iterable[str] = _STORED_EXTENSIONS,
+    compresslevel: int = None,
+    max_workers: int = None,
+    chunk_size: int = _ARCHIVE_CHUNK_SIZE,
+) -> List[str]:
     """
-    Zip files to folder. Enter a path to a dirctory, or a list of paths to files to zip.
+    Zip files to folder. Enter a path to a dirctory, or a list of paths to files (and/or directories) to zip. Directories are archived recursively.
 
     Args:
         zipped_filename (str, optional): Name of zipped folder. Defaults to None.
         to_zip (Sequence[str] | str, optional): Path to directory or list of paths to zip. Defaults to None.
         mode (literal["w", "x", "a"], optional): Zipping mode. Defaults to "w".
+        include (Sequence[str], optional): glob patterns (matched against the member name and its base name) a file must match to be archived. Defaults to None (all files).
+        exclude (Sequence[str], optional): glob patterns of files to leave out. Defaults to None.
+        store_extensions (Iterable[str], optional): file extensions that are stored without compression (e.g., data that is already compressed). Defaults to `_STORED_EXTENSIONS`.
+        compresslevel (int, optional): deflate level, from 0 to 9. Defaults to None (zlib's default).
+        max_workers (int, optional): number of worker processes compressing members. Use 1 to compress in this process. Defaults to None (number of CPUs).
+        chunk_size (int, optional): number of bytes read from (and copied into) the archive at a time. Defaults to 1 MiB.
+
+    Returns:
+        List[str]: names of the archived members, in archive order
 
     Notes:
     - Zipping modes:
         - `w` for writing to a new file
         - `x` for referring to an existing file.
         - `a` for appending to an existing file.
+    - Files are never read into memory whole. In parallel mode, each worker streams one file into a raw deflate stream in a temporary file next to the archive, and the main process copies the finished streams into the archive in order. At most a few members per worker are pending at any time, which bounds the temporary disk space.
+    - Splicing finished streams in relies on `ZipFile` internals (see `_can_splice`); if they are missing (or the archive isn't seekable), members are compressed in this process with `ZipFile.write` instead.
     """
+    members = _archive_members(to_zip, include, exclude)
+    store_extensions = {ext.lower() for ext in store_extensions}
+    level = zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel
+
+    def stored(path: str) -> bool:
+        return os.path.splitext(path)[1].lower() in store_extensions
+
     with ZipFile(zipped_filename, mode) as file:
-        files_list = list(to_zip) if os.path.isdir(to_zip) else to_zip
-        for _file in files_list:
-            file.write(_file)
+        deflated = [path for path, _ in members if not stored(path)]
+        if max_workers == 1 or len(deflated) < 2 or not _can_splice(file):
+            for path, arcname in members:
+                compress_type = ZIP_STORED if stored(path) else ZIP_DEFLATED
+                file.write(path, arcname, compress_type, compresslevel)
+            return [arcname for _, arcname in members]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        tmp_dir = tempfile.mkdtemp(
+            prefix=".zip-", dir=os.path.dirname(os.path.abspath(zipped_filename))
+        )
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                window = 4 * (max_workers or os.cpu_count() or 1)
+                jobs = iter(deflated)
+                pending = deque(
+                    executor.submit(_deflate_member, (path, tmp_dir, level, chunk_size))
+                    for path in islice(jobs, window)
+                )
+                for path, arcname in members:
+                    if stored(path):
+                        file.write(path, arcname, ZIP_STORED)
+                        continue
+
+                    member = pending.popleft().result()
+                    for next_path in islice(jobs, 1):
+                        pending.append(
+                            executor.submit(
+                                _deflate_member, (next_path, tmp_dir, level, chunk_size)
+                            )
+                        )
+                    _write_deflated_member(file, path, arcname, member, chunk_size)
+                    os.remove(member[0])
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return [arcname for _, arcname in members]
+
+
+def _select_members(
+    infos: Iterable[Any] = None, members: str | Sequence[str] | Callable = None
+) -> List[Any]:
+    """
+    Filters archive member infos (`ZipInfo` or `TarInfo`) by glob pattern(s) on their names, or by a predicate called with each info.
+    """
+    infos = list(infos)
+    if members is None:
+        return infos
+    if callable(members):
+        return [info for info in infos if members(info)]
+    if isinstance(members, str):
+        members = [members]
+    return [
+        info
+        for info in infos
+        if _match_globs(getattr(info, "filename", None) or info.name, members)
+    ]
+
+
+def _extract_zip_job(job: Tuple[str, List[str], str]) -> List[str]:
+    """Extracts the named members of a ZIP file. Worker for `zip_extract`."""
+    zipped_file, names, out_dir = job
+    with ZipFile(zipped_file) as file:
+        return [file.extract(name, out_dir) for name in names]
+
+
+def _stream_zip(
+    zipped_file: str = None,
+    members: str | Sequence[str] | Callable = None,
+    as_bytes: bool = False,
+) -> Iterator[Tuple[str, bytes | IO[bytes]]]:
+    """Yields `(name, bytes-or-file-object)` for the selected (non-directory) members of a ZIP file."""
+    with ZipFile(zipped_file) as file:
+        for info in _select_members(file.infolist(), members):
+            if info.is_dir():
+                continue
+            if as_bytes:
+                yield info.filename, file.read(info)
+            else:
+                with file.open(info) as member:
+                    yield info.filename, member
 
 
 def zip_extract(
     zipped_file: str = None,
     read_mode: Literal["r"] = "r",
-    extract_mode: Literal["folder", "lists"] = "folder",  # FIXME - not finished
+    extract_mode: Literal["folder", "lists", "stream"] = "folder",
     out_dir: str = None,
-) -> None:
+    members: str | Sequence[str] | Callable[[ZipInfo], bool] = None,
+    max_workers: int = 1,
+) -> List[str] | List[Tuple[str, bytes]] | Iterator[Tuple[str, IO[bytes]]]:
     """
     Extracts contents of a ZIP file.
 
     Args:
         zipped_file (str, optional): File path to zipped file. Defaults to None.
         read_mode (Literal[&quot;r&quot;], optional): File reading mode. Defaults to "r".
-        extract_mode (Literal[&quot;folder&quot;, &quot;lists&quot;], optional): ZIP extraction mode. Defaults to "folder".
+        extract_mode (Literal[&quot;folder&quot;, &quot;lists&quot;, &quot;stream&quot;], optional): ZIP extraction mode. Defaults to "folder".
         out_dir (str, optional): Directory you want to save the extracted contents to. Defaults to None.
+        members (str | Sequence[str] | Callable[[ZipInfo], bool], optional): glob pattern(s) matched against member names (and their base names), or a predicate called with each `ZipInfo`. Defaults to None (all members).
+        max_workers (int, optional): number of worker processes for the "folder" mode. Use None for the number of CPUs. Defaults to 1.
+
+    Returns:
+        List[str] | List[Tuple[str, bytes]] | Iterator[Tuple[str, IO[bytes]]]: the extracted paths ("folder"), a list of `(name, contents)` pairs ("lists"), or a generator of `(name, file object)` pairs ("stream")
+
+    Notes:
+    - Extraction modes:
+        - `folder` extracts the selected members to `out_dir`.
+        - `lists` reads the selected members into memory, without writing to disk.
+        - `stream` lazily yields an open, read-only file object per member. Each one is closed when the next member is requested, so read it before advancing.
+    - In parallel mode, the selected members are split across workers by size. Each worker opens the archive itself, so only the selected members are decompressed.
     """
-    # TODO - finish the second half of this function
+    if extract_mode in ("lists", "stream"):
+        streamed = _stream_zip(zipped_file, members, as_bytes=extract_mode == "lists")
+        return list(streamed) if extract_mode == "lists" else streamed
+    if extract_mode != "folder":
+        _msg = f"Unknown extract_mode '{extract_mode}'; expected 'folder', 'lists', or 'stream'"
+        raise ValueError(_msg)
+
     with ZipFile(zipped_file, read_mode) as file:
-        file.extractall(out_dir)
+        selected = _select_members(file.infolist(), members)
+        if max_workers == 1 or len(selected) < 2:
+            return [file.extract(info, out_dir) for info in selected]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Largest members first, each to the least loaded worker
+    n_workers = min(max_workers or os.cpu_count() or 1, len(selected))
+    loads, shares = [0] * n_workers, [[] for _ in range(n_workers)]
+    for info in sorted(selected, key=lambda info: info.file_size, reverse=True):
+        idx = loads.index(min(loads))
+        loads[idx] += info.file_size
+        shares[idx].append(info.filename)
+
+    # Workers would otherwise race to create the same parent directories
+    out_dir = os.getcwd() if out_dir is None else os.fspath(out_dir)
+    for info in selected:
+        parts = [
+            part
+            for part in info.filename.split("/")[:-1]
+            if part not in ("", ".", "..")
+        ]
+        os.makedirs(os.path.join(out_dir, *parts), exist_ok=True)
+
+    jobs = [(zipped_file, names, out_dir) for names in shares]
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return [
+            path for paths in executor.map(_extract_zip_job, jobs) for path in paths
+        ]
+
+
+def _write_xml_value(generator: Any = None, tag: str = None, value: Any = None) -> None:
+    """
+    Streams `value` as `<tag>` element(s) through an `XMLGenerator`.
+
+    Dictionaries become child elements, keys starting with `@` become attributes and `#text` the element's text, lists and tuples become repeated elements, None an empty element, and anything else the element's text.
+    """
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            _write_xml_value(generator, tag, item)
+        return
+    if not isinstance(value, dict):
+        generator.startElement(tag, {})
+        if value is not None:
+            generator.characters(str(value))
+        generator.endElement(tag)
+        return
+
+    attrs = {key[1:]: str(val) for key, val in value.items() if key.startswith("@")}
+    generator.startElement(tag, attrs)
+    if "#text" in value:  # before the children, where parsers read it back from
+        generator.characters(str(value["#text"]))
+    for key, val in value.items():
+        if key != "#text" and not key.startswith("@"):
+            _write_xml_value(generator, key, val)
+    generator.endElement(tag)
+
+
+def to_xml(
+    save_as: str = None,
+    records: Iterable[Dict[str, Any]] = None,
+    root: str = "records",
+    record_tag: str = "record",
+    mode: Literal["w", "wb"] = "wb",
+    encoding: str = "utf-8",
+    compression: str | Dict | None = "infer",
+) -> int:
+    """
+    Streams records (dictionaries) to an XML file, one `<record_tag>` element each, without building the document in memory.
+
+    Args:
+        save_as (str, optional): name to save file as. Defaults to None.
+        records (Iterable[Dict[str, Any]], optional): records to write (e.g., a generator). Defaults to None.
+        root (str, optional): tag of the root element. Defaults to "records".
+        record_tag (str, optional): tag of each record's element. Defaults to "record".
+        mode (Literal["w", "wb"], optional): File writing mode. Defaults to "wb".
+        encoding (str, optional): output encoding. Defaults to "utf-8".
+        compression (str | Dict | None, optional): see `_open_file`. Defaults to "infer".
+
+    Returns:
+        int: number of records written
+
+    Notes:
+        Records are converted as described in `_write_xml_value`, so `iter_xml(save_as, record_tag)` reads them back (as strings).
+    """
+    from xml.sax.saxutils import XMLGenerator
+
+    count = 0
+    with _open_file(save_as, mode[0] + "b", compression) as file:
+        generator = XMLGenerator(file, encoding, short_empty_elements=True)
+        generator.startDocument()
+        generator.startElement(root, {})
+        for count, record in enumerate(records, 1):
+            _write_xml_value(generator, record_tag, record)
+        generator.endElement(root)
+        generator.endDocument()
+    return count
 
 
 def save_dict2xml(
-    data: Dict[str, Any] = None, save_as: str = None, mode: Literal["w", "wb"] = "wb"
+    data: Dict[str, Any] = None,
+    save_as: str = None,
+    mode: Literal["w", "wb"] = "wb",
+    root: str = "root",
+    encoding: str = "utf-8",
+    compression: str | Dict | None = "infer",
 ) -> None:
     """
     Saves a dictionary to an XML file.
 
     Args:
-        data (Dict[str, Any], optional): Dictionary that you want to save. Defaults to None.
+        data (Dict[str, Any], optional): Dictionary that you want to save (or an XML string, written as-is). Defaults to None.
         save_as (str, optional): Name you are saving the XML file as. Defaults to None.
         mode (Literal[&quot;w&quot;, &quot;wb&quot;], optional): File writing mode. Defaults to "wb".
+        root (str, optional): Tag of the root element; ignored if `data` has a single key, which then becomes the root. Defaults to "root".
+        encoding (str, optional): Output encoding. Defaults to "utf-8".
+        compression (str | Dict | None, optional): see `_open_file`. Defaults to "infer".
+
+    Notes:
+        The dictionary is streamed to the file element by element (see `_write_xml_value`), and nested values may be generators.
     """
-    data = data.encode()
-    with open(save_as, mode) as file:
-        file.write(data)
+    from xml.sax.saxutils import XMLGenerator
+
+    with _open_file(save_as, mode[0] + "b", compression) as file:
+        if isinstance(data, (str, bytes)):
+            file.write(data.encode(encoding) if isinstance(data, str) else data)
+            return
+
+        generator = XMLGenerator(file, encoding, short_empty_elements=True)
+        generator.startDocument()
+        if len(data) == 1:
+            _write_xml_value(generator, *next(iter(data.items())))
+        else:
+            _write_xml_value(generator, root, data)
+        generator.endDocument()
+
+
+def _xml_to_dict(element: Any = None) -> Dict[str, Any] | str | None:
+    """Converts an element to a dictionary (the inverse of `_write_xml_value`), or to its text if it has no attributes or children."""
+    text = element.text.strip() if element.text and element.text.strip() else None
+    if not len(element) and not element.attrib:
+        return text
+
+    result = {f"@{key}": value for key, value in element.attrib.items()}
+    for child in element:
+        value = _xml_to_dict(child)
+        if child.tag not in result:
+            result[child.tag] = value
+        elif isinstance(result[child.tag], list):
+            result[child.tag].append(value)
+        else:
+            result[child.tag] = [result[child.tag], value]
+    if text is not None:
+        result["#text"] = text
+    return result
 
 
-def extract_tar(tarfile: str = None, path: str = None) -> None:
+def iter_xml(
+    filename: str = None,
+    tag: str = None,
+    compression: str | Dict | None = "infer",
+) -> Iterator[Dict[str, Any] | str | None]:
+    """
+    Lazily yields the records of an XML file, converted to dictionaries (see `_xml_to_dict`), with `iterparse`.
+
+    Args:
+        filename (str, optional): name of the file to read. Defaults to None.
+        tag (str, optional): tag of the record elements, at any depth (namespaced tags as `{uri}tag`). Defaults to None (the children of the root element).
+        compression (str | Dict | None, optional): see `_open_file`. Defaults to "infer".
+
+    Yields:
+        Dict[str, Any] | str | None: one converted record at a time
+
+    Notes:
+        Every element is removed from its parent once it is complete (and, for a record, converted), unless it is part of a record that is still open, so memory use stays flat however large the file is.
+    """
+    from xml.etree.ElementTree import iterparse
+
+    def is_record(element: Any = None, depth: int = None) -> bool:
+        return element.tag == tag if tag is not None else depth == 1
+
+    with _open_file(filename, "rb", compression) as file:
+        parents, open_records = [], 0
+        for event, element in iterparse(file, events=("start", "end")):
+            if event == "start":
+                open_records += is_record(element, len(parents))
+                parents.append(element)
+                continue
+
+            parents.pop()
+            if is_record(element, len(parents)):
+                open_records -= 1
+                yield _xml_to_dict(element)
+            if not open_records and parents:
+                parents[-1].remove(element)
+
+
+def _stream_tar(
+    tarfile: str = None,
+    members: str | Sequence[str] | Callable = None,
+    as_bytes: bool = False,
+) -> Iterator[Tuple[str, bytes | IO[bytes]]]:
+    """Yields `(name, bytes-or-file-object)` for the selected regular files of a (possibly compressed) `.tar` file, in one sequential pass."""
+    import tarfile as tar
+
+    with tar.open(tarfile, "r|*") as file:
+        for info in file:
+            if not info.isfile() or not _select_members([info], members):
+                continue
+            member = file.extractfile(info)
+            yield info.name, member.read() if as_bytes else member
+
+
+def extract_tar(
+    tarfile: str = None,
+    path: str = None,
+    members: str | Sequence[str] | Callable[[Any], bool] = None,
+    extract_mode: Literal["folder", "lists", "stream"] = "folder",
+) -> List[str] | List[Tuple[str, bytes]] | Iterator[Tuple[str, IO[bytes]]]:
     """
     Extracts data from a `.tar` file.
 
     Parameters
     ----------
     tarfile : str, optional
-        Path to your `.tar` file, by default None
+        Path to your `.tar` file (compressed or not), by default None
     path : str, optional
         Path where you want to save the data to, by default None
+    members : str | Sequence[str] | Callable[[TarInfo], bool], optional
+        Glob pattern(s) matched against member names (and their base names), or a predicate called with each `TarInfo`, by default None (all members)
+    extract_mode : Literal["folder", "lists", "stream"], optional
+        Extraction mode, as in `zip_extract`, by default "folder"
+
+    Returns
+    -------
+    List[str] | List[Tuple[str, bytes]] | Iterator[Tuple[str, IO[bytes]]]
+        The extracted member names ("folder"), a list of `(name, contents)` pairs ("lists"), or a generator of `(name, file object)` pairs ("stream")
+
+    Notes
+    -----
+    Members are extracted with the `"data"` filter (where available), which rejects absolute paths, links outside `path`, and device files. The "lists" and "stream" modes read the archive in a single sequential pass, so compressed archives are never seeked. Unlike ZIP members, tar members can't be decompressed independently, so there is no parallel mode.
     """
-    with tarfile.open(tarfile) as file:
-        file.extractall(path)
+    import tarfile as tar
+
+    if extract_mode in ("lists", "stream"):
+        streamed = _stream_tar(tarfile, members, as_bytes=extract_mode == "lists")
+        return list(streamed) if extract_mode == "lists" else streamed
+    if extract_mode != "folder":
+        _msg = f"Unknown extract_mode '{extract_mode}'; expected 'folder', 'lists', or 'stream'"
+        raise ValueError(_msg)
+
+    kwargs = {"filter": "data"} if hasattr(tar, "data_filter") else {}
+    with tar.open(tarfile) as file:
+        selected = _select_members(file.getmembers(), members)
+        file.extractall(path, members=selected, **kwargs)
+    return [info.name for info in selected]
+
+
+class _ArchiveSection(io.RawIOBase):
+    """
+    Read-only window of `size` bytes at `offset` in a (possibly decompressing) binary stream.
+
+    Forward-only streams are skipped ahead from `position`, the stream's current offset.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes] = None,
+        offset: int = 0,
+        size: int = 0,
+        position: int = 0,
+        close_stream: bool = True,
+    ) -> None:
+        super().__init__()
+        self._fileobj = fileobj
+        self._close_stream = close_stream
+        self.remaining = size
+        if fileobj.seekable():
+            fileobj.seek(offset)
+        else:
+            while position < offset:
+                skipped = len(fileobj.read(min(offset - position, _ARCHIVE_CHUNK_SIZE)))
+                if not skipped:
+                    raise EOFError("Archive ended before the requested member")
+                position += skipped
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._fileobj.read(min(len(buffer), self.remaining))
+        buffer[: len(data)] = data
+        self.remaining -= len(data)
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed and self._close_stream:
+            self._fileobj.close()
+        super().close()
+
+
+class ArchiveReader:
+    """
+    Read-only, random-access view over the files of a ZIP or `.tar` archive, without extracting it.
+
+    ZIP archives are indexed by their own central directory. For tar archives, the data offset and size of every regular file are recorded in one pass and saved next to the archive (as `<filename>.idx`) together with the archive's size and modification time, so reopening it only reads the sidecar. The index is rebuilt automatically when the archive changes, and only kept in memory when the sidecar can't be written (e.g., on a read-only mount). Members of uncompressed tar files are read by seeking; compressed tar files can be indexed too, but reading a member still decompresses the archive up to it (iterate with `members` to read many in one pass).
+
+    Attributes:
+        filename (str): Path to the archive.
+        index_path (str): Path to the sidecar index file (tar archives only).
+        kind (str): `"zip"` or `"tar"`.
+        compression (str | None): Compression method of a tar archive (see `_open_file`).
+        members (Dict[str, Tuple[int, int]]): Member names mapped to their offset and (uncompressed) size.
+
+    Args:
+        filename (str=None): Path to the archive.
+        cache_index (bool=True): Whether to load (and save) the sidecar index of a tar archive.
+    """
+
+    extension = _SIDECAR_EXTENSION
+
+    def __init__(self, filename: str = None, cache_index: bool = True) -> None:
+        self.filename = os.fspath(filename)
+        self.index_path = self.filename + self.extension
+        self.kind = "zip" if is_zipfile(self.filename) else "tar"
+        self.compression = None
+        self.members = {}
+        self._zip = None
+
+        if self.kind == "zip":
+            self._zip = ZipFile(self.filename)
+            self.members = {
+                info.filename: (info.header_offset, info.file_size)
+                for info in self._zip.infolist()
+                if not info.is_dir()
+            }
+            return
+
+        self.compression = _detect_compression(self.filename, "rb")
+        if not (cache_index and self.load()):
+            self.build(save=cache_index)
+
+    def __enter__(self) -> ArchiveReader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.members
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.members)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.members)
+
+    @property
+    def _signature(self) -> Dict[str, Any]:
+        stat = os.stat(self.filename)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def load(self) -> bool:
+        """Loads the sidecar index. Returns False if it is missing or stale."""
+        sidecar = _read_sidecar(self.index_path, self._signature)
+        try:
+            members = json.loads(sidecar[1])
+        except (TypeError, ValueError):
+            return False
+        self.members = {name: tuple(entry) for name, entry in members.items()}
+        return True
+
+    def build(self, save: bool = True) -> None:
+        """Scans the tar archive once, recording the offset and size of every regular file, and (optionally) saves the index."""
+        import tarfile as tar
+
+        signature = self._signature
+        with _open_file(self.filename, "rb", self.compression) as stream:
+            with tar.open(fileobj=stream, mode="r|") as file:
+                self.members = {
+                    info.name: (info.offset_data, info.size)
+                    for info in file
+                    if info.isfile()
+                }
+        if save:
+            self.save(signature)
+
+    def save(self, signature: Dict[str, Any] = None) -> None:
+        """Atomically writes the index next to the archive (skipped if the directory isn't writable)."""
+        payload = json.dumps(self.members).encode() + b"\n"
+        _write_sidecar(self.index_path, signature or self._signature, payload)
+
+    def glob(self, pattern: str | Sequence[str] = None) -> List[str]:
+        """Names of the members matching glob pattern(s), checked against the member name and its base name."""
+        patterns = [pattern] if isinstance(pattern, str) else pattern
+        return [name for name in self.members if _match_globs(name, patterns)]
+
+    def _entry(self, name: str = None) -> Tuple[int, int]:
+        try:
+            return self.members[name]
+        except KeyError:
+            _msg = f"There is no member named '{name}' in '{self.filename}'"
+            raise KeyError(_msg) from None
+
+    def open(self, name: str = None) -> IO[bytes]:
+        """
+        Opens a member as a read-only binary file object.
+
+        Raises:
+            KeyError: If the archive has no such member.
+        """
+        offset, size = self._entry(name)
+        if self._zip is not None:
+            return self._zip.open(name)
+        stream = _open_file(self.filename, "rb", self.compression)
+        return io.BufferedReader(_ArchiveSection(stream, offset, size))
+
+    def read(self, name: str = None) -> bytes:
+        """
+        Reads a member's contents.
+
+        Raises:
+            KeyError: If the archive has no such member.
+        """
+        with self.open(name) as file:
+            return file.read()
+
+    def iter_members(
+        self, pattern: str | Sequence[str] = None, as_bytes: bool = False
+    ) -> Iterator[Tuple[str, bytes | IO[bytes]]]:
+        """
+        Yields `(name, bytes-or-file-object)` for the members matching `pattern` (all members by default).
+
+        Tar members are read in archive order through a single stream, so a compressed archive is decompressed once. Each file object is only valid until the next member is requested.
+        """
+        names = self.glob(pattern) if pattern else self.names
+        if self._zip is not None:
+            for name in names:
+                if as_bytes:
+                    yield name, self._zip.read(name)
+                else:
+                    with self._zip.open(name) as file:
+                        yield name, file
+            return
+
+        names.sort(key=lambda name: self.members[name][0])
+        with _open_file(self.filename, "rb", self.compression) as stream:
+            position = 0
+            for name in names:
+                offset, size = self.members[name]
+                section = _ArchiveSection(
+                    stream, offset, size, position, close_stream=False
+                )
+                with io.BufferedReader(section) as file:
+                    yield name, file.read() if as_bytes else file
+                position = offset + size - section.remaining
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+
+
+def _as_tensor(
+    y: Sequence | np.ndarray | DataFrame = None, conv_type: Any = None
+) -> torch.Tensor:
+    """
+    Converts a DataFrame, Series, ndarray, or sequence to a tensor of dtype `conv_type`, sharing memory with the source whenever its dtype (and memory layout) already matches.
+    """
+    import numpy as np
+    import torch
+
+    if hasattr(y, "to_numpy"):
+        y = y.to_numpy()
+    if isinstance(conv_type, torch.dtype):
+        # NumPy dtype equivalent of the tensor dtype, so at most one cast (copy) happens
+        y = np.asarray(y, dtype=torch.empty(0, dtype=conv_type).numpy().dtype)
+    else:
+        y = np.asarray(y)
+    if any(stride < 0 for stride in y.strides):
+        y = np.ascontiguousarray(y)
+
+    with warnings.catch_warnings():
+        # Pandas' copy-on-write arrays are read-only; the tensor shares (and must not modify) them
+        warnings.filterwarnings("ignore", "The given NumPy array is not writable")
+        tensor = torch.from_numpy(y)
+    return (
+        tensor
+        if conv_type is None or isinstance(conv_type, torch.dtype)
+        else tensor.type(conv_type)
+    )
+
+
+def _share_tensor(
+    y: torch.Tensor = None, pin_memory: bool = False, share_memory: bool = False
+) -> torch.Tensor:
+    """Moves a tensor to page-locked and/or shared memory (each of which copies it once)."""
+    if share_memory:
+        y = y.share_memory_()
+    if pin_memory:
+        y = y.pin_memory()
+    return y
 
 
 def list2tensor(
-    y: Sequence | np.array, sqz: int = 1, conv_type: Callable = torch.int64
+    y: Sequence | np.array | DataFrame = None,
+    sqz: int = 1,
+    conv_type: Callable = None,
+    pin_memory: bool = False,
+    share_memory: bool = False,
 ) -> torch.Tensor:
     """
     Converts an array (or list) into a `PyTorch` tensor (`torch.Tensor`).
 
     Parameters
     ----------
-    y : Sequence | np.array
-        Sequence that you want to convert to a tensor.
+    y : Sequence | np.array | DataFrame
+        Sequence that you want to convert to a tensor (a list, NumPy array, Pandas Series, or DataFrame).
     sqz : int, optional
-        Squeeze value, by default 1
+        Squeeze value (ignored if the tensor has no such dimension; None to not squeeze), by default 1
     conv_type : Callable, optional
         Type you want to convert the tensor values to, by default torch.int64
+    pin_memory : bool, optional
+        Copy the tensor into page-locked memory (for fast, asynchronous transfers to the GPU; requires CUDA), by default False
+    share_memory : bool, optional
+        Move the tensor into shared memory, so it can be handed to worker processes without copying, by default False
 
     Returns
     -------
     torch.Tensor
         Final tensor from sequence.
+
+    Notes
+    -----
+    When the data already has the dtype of `conv_type` (e.g., an `int64` column and the default `torch.int64`), the tensor shares memory with it instead of copying it (`torch.from_numpy`). Otherwise it is cast exactly once. A tensor sharing memory with a (copy-on-write) DataFrame must be treated as read-only.
     """
-    y = y.to_numpy()
-    y = torch.Tensor(y)
-    y = y.squeeze(sqz)
-    y = y.type(conv_type)
-    return y
+    import torch
+
+    y = _as_tensor(y, conv_type or torch.int64)
+    if sqz is not None and -y.dim() <= sqz < y.dim():
+        y = y.squeeze(sqz)
+    return _share_tensor(y, pin_memory, share_memory)
+
+
+def tensor_batches(
+    data: Sequence | np.ndarray | DataFrame = None,
+    batch_size: int = 1024,
+    conv_type: Callable = None,
+    sqz: int = None,
+    drop_last: bool = False,
+    pin_memory: bool = False,
+    share_memory: bool = False,
+) -> Iterator[torch.Tensor]:
+    """
+    Yields fixed-size batches (along the first dimension) of a large array or frame as tensors.
+
+    The data is converted once, as in `list2tensor` (without a copy when its dtype matches `conv_type`), and every batch is a view of that tensor.
+
+    Args:
+        data (Sequence | np.ndarray | DataFrame, optional): data to batch. Defaults to None.
+        batch_size (int, optional): number of rows per batch. Defaults to 1024.
+        conv_type (Callable, optional): tensor dtype. Defaults to None (keep the data's dtype).
+        sqz (int, optional): dimension to squeeze from every batch (if it has it). Defaults to None.
+        drop_last (bool, optional): skip the last batch if it is smaller than `batch_size`. Defaults to False.
+        pin_memory (bool, optional): copy each batch into page-locked memory (requires CUDA). Defaults to False.
+        share_memory (bool, optional): move the whole tensor into shared memory once, so batches can be sent to worker processes without copying. Defaults to False.
+
+    Yields:
+        torch.Tensor: batches of at most `batch_size` rows
+    """
+    tensor = _share_tensor(_as_tensor(data, conv_type), share_memory=share_memory)
+    stop = len(tensor) - len(tensor) % batch_size if drop_last else len(tensor)
+    for start in range(0, stop, batch_size):
+        batch = tensor[start : start + batch_size]
+        if sqz is not None and -batch.dim() <= sqz < batch.dim():
+            batch = batch.squeeze(sqz)
+        yield _share_tensor(batch, pin_memory=pin_memory)
+
+
+def _smallest_dtype(column: Any = None, category_threshold: float = 0.5) -> Any:
+    """
+    Finds the smallest dtype that holds a column's values without loss, or None to keep its dtype.
 
+    Integers get the narrowest integer type covering their range (signed where that is as narrow, never wider than the current type), floats are narrowed to `float32` if every value round-trips exactly, and object or string columns become `category` if at most `category_threshold` of their values are distinct.
+    """
+    import numpy as np
+
+    dtype = column.dtype
+    if not len(column):
+        return None
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        low, high = column.min(), column.max()
+        signed = (np.int8, np.int16, np.int32, np.int64)
+        unsigned = (np.uint8, np.uint16, np.uint32, np.uint64)
+        # Prefer signed types, unless only an unsigned one is narrower
+        candidates = signed if dtype.kind == "i" else unsigned + signed
+        fits = [
+            np.dtype(candidate)
+            for candidate in candidates
+            if np.iinfo(candidate).min <= low and high <= np.iinfo(candidate).max
+        ]
+        best = min(fits, key=lambda fit: (fit.itemsize, fit.kind != "i"), default=None)
+        return best if best is not None and best.itemsize < dtype.itemsize else None
+    if isinstance(dtype, np.dtype) and dtype == np.float64:
+        values = column.to_numpy()
+        with np.errstate(over="ignore"):
+            narrowed = values.astype(np.float32)
+        return (
+            np.dtype(np.float32)
+            if np.array_equal(narrowed, values, equal_nan=True)
+            else None
+        )
+    if dtype == object or str(dtype) in ("string", "str"):
+        if column.nunique(dropna=False) <= category_threshold * len(column):
+            return "category"
+    return None
+
+
+def optimize_dtypes(
+    df: DataFrame = None,
+    dtypes: Dict[Hashable, Any] = None,
+    downcast: bool = True,
+    category_threshold: float = 0.5,
+) -> Tuple[DataFrame, Dict[str, Any]]:
+    """
+    Shrinks a DataFrame's memory footprint by converting its columns to the smallest dtypes that hold their values.
+
+    Args:
+        df (DataFrame, optional): DataFrame to optimize. Defaults to None.
+        dtypes (Dict[Hashable, Any], optional): explicit dtypes for some columns, which take precedence over the inferred ones. Defaults to None.
+        downcast (bool, optional): infer dtypes for the other columns (see `_smallest_dtype`). Defaults to True.
+        category_threshold (float, optional): largest fraction of distinct values for which an object/string column becomes `category`. Defaults to 0.5.
+
+    Returns:
+        Tuple[DataFrame, Dict[str, Any]]: the converted DataFrame, and a report with the memory usage in bytes `"before"` and `"after"` (deep `memory_usage`, index included), the bytes `"saved"`, and the `"converted"` columns mapped to their `(old, new)` dtypes
 
-def conv2str(df: DataFrame = None, dtype: str = "str"):
+    Notes:
+        All conversions happen in a single `astype` call. Unsigned integers become signed where that is just as narrow, so downcast columns stay safe to subtract; no column is ever widened.
+    """
+    before = int(df.memory_usage(deep=True).sum())
+    targets = {}
+    if downcast:
+        for colname in df.columns:
+            target = _smallest_dtype(df[colname], category_threshold)
+            if target is not None:
+                targets[colname] = target
+    targets.update(dtypes or {})
+
+    converted = df.astype(targets) if targets else df.copy(deep=False)
+    after = int(converted.memory_usage(deep=True).sum())
+    report = {
+        "before": before,
+        "after": after,
+        "saved": before - after,
+        "converted": {
+            colname: (str(df[colname].dtype), str(converted[colname].dtype))
+            for colname in targets
+            if df[colname].dtype != converted[colname].dtype
+        },
+    }
+    return converted, report
+
+
+def conv2str(df: DataFrame = None, dtype: str = "str") -> DataFrame:
     """
     Converts all columns of a given DataFrame into a desired data type.
 
     Parameters
     ----------
     df : DataFrame, optional
-        DataFrame that you want to convert, by default None
+        DataFrame that you want to convert (in place), by default None
     dtype : str, optional
         Data type you want to convert the columns to, by default "str"
+
+    Returns
+    -------
+    DataFrame
+        The converted DataFrame (the same object as `df`).
+
+    Raises
+    ------
+    ValueError, TypeError
+        If a column can't be converted to `dtype`.
+
+    Notes
+    -----
+    All columns are converted in one `astype` call. To shrink a DataFrame's memory footprint, use `optimize_dtypes` instead.
     """
+    converted = df.astype(dtype)
     for colname in df.columns:
-        try:
-            df[colname] = df[colname].astype(dtype)
-            print(f"'{colname}' converted to {dtype}")
-        except:
-            print(f"'{colname}' conversion failed")
+        df[colname] = converted[colname]
+    return df
 
 
 def combine_list(strings: list) -> str:
@@ -343,51 +2776,237 @@ def combine_list(strings: list) -> str:
     return "".join(strings).strip()
 
 
-def normalize(matrix: np.array | Sequence = None) -> np.array:
+def _norm_partial(
+    block: np.ndarray = None, ord: float = 2, axis: int = None
+) -> np.ndarray:
+    """Partial norm of a block (sum of squares, sum of absolute values, or largest absolute value), accumulated in float64."""
+    import numpy as np
+
+    if ord == 2:
+        return np.sum(np.square(block, dtype=np.float64), axis=axis, keepdims=True)
+    if ord == 1:
+        return np.sum(np.abs(block), axis=axis, dtype=np.float64, keepdims=True)
+    return np.max(np.abs(block), axis=axis, keepdims=True).astype(np.float64)
+
+
+def normalize(
+    matrix: np.array | Sequence = None,
+    axis: int = None,
+    ord: Literal[1, 2, "max"] | float = 2,
+    out: np.ndarray = None,
+    chunk_size: int = None,
+) -> np.array:
     """
     Divides matrix (or array) my its norm for normalization.
 
     Parameters
     ----------
     matrix : np.array | Sequence, optional
-        Matrix (or array) that you want to normalize, by default None
+        Matrix (or array) that you want to normalize (may be an `np.memmap`), by default None
+    axis : int, optional
+        Axis along which norms are taken (e.g., 1 to normalize every row of a 2-D matrix, 0 for every column), by default None (one norm over all values)
+    ord : Literal[1, 2, "max"] | float, optional
+        Norm order: 1, 2, or "max" (`np.inf`, the largest absolute value), by default 2
+    out : np.ndarray, optional
+        Array to write the result to (pass `matrix` itself to normalize in place), by default None (a new array)
+    chunk_size : int, optional
+        Number of entries along the first axis processed at a time, by default None (about 64 MiB worth)
 
     Returns
     -------
     np.array
-        Normalized array or matrix.
+        Normalized array or matrix (`out`, if given).
+
+    Notes
+    -----
+    The matrix is processed in chunks along its first axis, so temporary arrays never exceed one chunk (plus the norms), and memory-mapped arrays larger than memory can be normalized into a memory-mapped `out`. Norms over the first axis (or all values) take two passes. Floating-point inputs keep their dtype (e.g., `float32`); other inputs become `float64`. Slices with a norm of zero are left unchanged; scalars (0-d arrays) are normalized as a whole and empty arrays are returned as is.
     """
-    norm = np.linalg.norm(matrix)
-    return matrix / norm
+    import numpy as np
+
+    if not isinstance(matrix, np.ndarray):
+        matrix = np.asarray(matrix)
+    ord = np.inf if ord == "max" else ord
+    if ord not in (1, 2, np.inf):
+        _msg = f"Unsupported norm order '{ord}'; expected 1, 2, or 'max'"
+        raise ValueError(_msg)
+    if axis is not None:
+        axis = range(matrix.ndim)[axis]  # negative axes count from the end
+    if out is None:
+        dtype = matrix.dtype if np.issubdtype(matrix.dtype, np.floating) else np.float64
+        out = np.empty(matrix.shape, dtype=dtype)
+
+    if matrix.size == 0:
+        return out
+    if matrix.ndim == 0:
+        chunks = [Ellipsis]  # a scalar has no first axis to chunk over
+    else:
+        chunk_size = chunk_size or max(1, _MMAP_THRESHOLD // max(1, matrix[:1].nbytes))
+        chunks = [
+            slice(start, start + chunk_size)
+            for start in range(0, len(matrix), chunk_size)
+        ]
+
+    def finish(partial: np.ndarray) -> np.ndarray:
+        norms = np.sqrt(partial) if ord == 2 else partial
+        return np.where(norms == 0, 1, norms).astype(out.dtype, copy=False)
+
+    if axis is not None and axis != 0:
+        # Each chunk holds whole slices along `axis`: one pass
+        for chunk in chunks:
+            block = matrix[chunk]
+            np.divide(block, finish(_norm_partial(block, ord, axis)), out=out[chunk])
+    else:
+        total = None
+        for chunk in chunks:
+            partial = _norm_partial(matrix[chunk], ord, axis)
+            if total is None:
+                total = partial
+            elif ord == np.inf:
+                np.maximum(total, partial, out=total)
+            else:
+                total += partial
+        norms = finish(total)
+        for chunk in chunks:
+            np.divide(matrix[chunk], norms, out=out[chunk])
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+_CONFIG_TYPES = {"str": str, "int": int, "float": float, "bool": bool}
+"""Type names accepted by `ParseConfig.get_val`, mapped to the types of its lookup tables."""
+
+
+def _parse_config(filepath: str = None) -> MappingProxyType:
+    """
+    Parses a config file once into frozen lookup tables: `{type: {(section, key): value}}`.
 
+    Every value is stored as a string and, where it converts, as an int, float, and bool (using `ConfigParser`'s rules, interpolation, and `DEFAULT` section). Values that fail to interpolate are kept in an `errors` table instead, so only looking them up raises. Keys are stored as normalized by the parser's `optionxform` (lower-cased), which is kept in the tables for lookups.
+    """
+    parser = ConfigParser()
+    with open(filepath) as file:
+        parser.read_file(file)
+
+    tables = {type_: {} for type_ in _CONFIG_TYPES.values()}
+    errors = {}
+    for section in [parser.default_section, *parser.sections()]:
+        for key in parser[section]:
+            try:
+                value = parser.get(section, key)
+            except InterpolationError as error:
+                errors[section, key] = error
+                continue
+            tables[str][section, key] = value
+            for type_, convert in (
+                (int, int),
+                (float, float),
+                (bool, lambda value: parser.BOOLEAN_STATES[value.lower()]),
+            ):
+                try:
+                    tables[type_][section, key] = convert(value)
+                except (KeyError, ValueError):
+                    pass
+
+    tables = {type_: MappingProxyType(table) for type_, table in tables.items()}
+    tables["errors"] = MappingProxyType(errors)
+    tables["sections"] = tuple(parser.sections())
+    tables["optionxform"] = parser.optionxform  # keys are stored normalized
+    return MappingProxyType(tables)
+
+
+class ParseConfig:
+    """
+    Read-only, typed access to an INI-style config file.
 
-class ParseConfig(ConfigParser):
-    # FIXME - NOT WORKING
-    def __init__(self, filepath: str = None) -> None:
-        self.path = filepath
+    The file is parsed once into frozen lookup tables (one per type), so every `get_val` is a single dictionary lookup. The file's modification time is checked at most once every `check_interval` seconds, and the tables are rebuilt only when it (or the file size) has changed.
 
-        self._FILE = ConfigParser(self.path)
-        self._parsed_file = self._FILE.read()
+    Attributes:
+        path (str): Path to the config file.
+        check_interval (float | None): Minimum number of seconds between checks for changes to the file; None never reloads.
+
+    Args:
+        filepath (str=None): Path to the config file.
+        cache (bool=False): Share the parsed tables through `file_cache` (e.g., between several `ParseConfig`s of the same file).
+        check_interval (float | None=1.0): Minimum number of seconds between checks for changes to the file.
+
+    Example:
+        >>> config = ParseConfig("settings.ini")
+        >>> config.get_val("training", "epochs", int)
+    """
+
+    def __init__(
+        self, filepath: str = None, cache: bool = False, check_interval: float = 1.0
+    ) -> None:
+        self.path = filepath
+        self.check_interval = check_interval
+        self._cache = cache
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-parses the file (or fetches it from `file_cache`)."""
+        stat = os.stat(self.path)
+        self._signature = (stat.st_mtime_ns, stat.st_size)
+        self._checked = time.monotonic()
+        # with `cache`, the parsed tables are shared through `file_cache` (read-only)
+        self._tables = (
+            file_cache.get(self.path, _parse_config, "config")
+            if self._cache
+            else _parse_config(self.path)
+        )
+        self._optionxform = self._tables["optionxform"]
+
+    def _check(self) -> None:
+        """Reloads the tables if the file changed, stat-ing it at most once per `check_interval`."""
+        now = time.monotonic()
+        if self.check_interval is None or now - self._checked < self.check_interval:
+            return
+        self._checked = now
+        stat = os.stat(self.path)
+        if (stat.st_mtime_ns, stat.st_size) != self._signature:
+            self.reload()
 
     def get_val(
         self,
         section: str = None,
         key: str = None,
-        _type: Literal["str", "bool", "int", "float"] = None,
+        _type: Literal["str", "bool", "int", "float"] | type = "str",
     ) -> Any:
-        if not _type:
-            return None
-
-        match _type:
-            case "str":
-                return self._parsed_file.get(section, key)
-            case "bool":
-                return self._parsed_file.getboolean(section, key)
-            case "int":
-                return self._parsed_file.getint(section, key)
-            case "float":
-                return self._parsed_file.getfloat(section, key)
+        """
+        Gets a value of a section, converted to `_type`.
+
+        Args:
+            section (str, optional): Section name. Defaults to None.
+            key (str, optional): Key within the section. Defaults to None.
+            _type (Literal["str", "bool", "int", "float"] | type, optional): Type name, or the type itself. Defaults to "str".
+
+        Returns:
+            Any: The converted value.
+
+        Raises:
+            KeyError: If the section has no such key.
+            ValueError: If the value can't be converted to `_type`.
+            InterpolationError: If the value can't be interpolated.
+        """
+        self._check()
+        type_ = _CONFIG_TYPES.get(_type, _type)
+        if type_ not in _CONFIG_TYPES.values():
+            _msg = f"Unsupported type '{_type}'; expected one of {list(_CONFIG_TYPES)}"
+            raise ValueError(_msg)
+        table = self._tables[type_]
+        name = self._optionxform(key)
+        if (section, name) in self._tables["errors"]:
+            raise self._tables["errors"][section, name]
+        try:
+            return table[section, name]
+        except KeyError:
+            if (section, name) not in self._tables[str]:
+                _msg = f"No key '{key}' in section '{section}' of '{self.path}'"
+                raise KeyError(_msg) from None
+            _msg = f"Value of '{key}' in section '{section}' is not a valid {_type}"
+            raise ValueError(_msg) from None
 
     @property
-    def cfgsections(self):
-        return self._parsed_file.sections()
+    def cfgsections(self) -> List[str]:
+        self._check()
+        return list(self._tables["sections"])
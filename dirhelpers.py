@@ -2,31 +2,144 @@
 Sorting, deleting, copying files, and dealing with directories
 
 Functions:
+- class `DirectoryIndex`
+- function `claim_unique_name`
 - function `delete_filetype`
 - function `file_filter`
+- function `walk_files`
 - function `joinpths`
 - function `mkdirectory`
+- function `newest_files`
 - function `uniquefilename`
 """
 import glob
+import hashlib
+import heapq
 import os
-from typing import List, Tuple
+import re
+import sqlite3
+import time
+from fnmatch import translate
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Sequence,
+    Tuple,
+)
 from .utilities.strtools import num_to_word
 
 
-def delete_filetype(folder: str = ..., *filetypes: str) -> None:
+def _unlink_batch(
+    files: List[Tuple[str, int]] = None,
+) -> Tuple[int, int, List[Tuple[str, str]]]:
+    """Deletes a batch of `(path, size)` files for `delete_filetype`, returning how many files and bytes were deleted, and the failures."""
+    deleted, freed, errors = 0, 0, []
+    for path, size in files:
+        try:
+            os.unlink(path)
+            deleted += 1
+            freed += size
+        except FileNotFoundError:  # already gone
+            pass
+        except OSError as error:
+            errors.append((path, str(error)))
+    return deleted, freed, errors
+
+
+def delete_filetype(
+    folder: str = ...,
+    *filetypes: str,
+    recursive: bool = False,
+    older_than: float = None,
+    larger_than: int = None,
+    predicate: Callable[[os.DirEntry], bool] = None,
+    prune: str | Iterable[str] = ".*",
+    dry_run: bool = False,
+    max_workers: int = None,
+    batch_size: int = 1000,
+) -> Dict[str, Any]:
     """
     Deletes files of specific type
 
     Args:
         folder (str, optional): target directory. Defaults to ....
+        filetypes (str): extensions (`"tmp"`, `".tmp"`) or globs (`"scratch_*"`) of the files to delete. Defaults to any file, as long as another filter is given.
+        recursive (bool, optional): also delete in subdirectories. Defaults to False.
+        older_than (float, optional): only delete files last modified more than this many seconds ago. Defaults to None.
+        larger_than (int, optional): only delete files larger than this many bytes. Defaults to None.
+        predicate (Callable[[os.DirEntry], bool], optional): only delete files for which this returns True. Defaults to None.
+        prune (str | Iterable[str], optional): globs of directory names not to descend into; pass None to also descend into hidden directories. Defaults to ".*" (hidden directories such as `.git`, as in `file_filter`).
+        dry_run (bool, optional): only report what would be deleted. Defaults to False.
+        max_workers (int, optional): number of threads deleting batches of files. Defaults to None (`ThreadPoolExecutor`'s default).
+        batch_size (int, optional): number of files per deletion batch. Defaults to 1000.
+
+    Returns:
+        Dict[str, Any]: summary with the number of `"matched"` and `"deleted"` files, the `"bytes"` they take up (freed, unless `dry_run`), the `"errors"` as `(path, message)` pairs, and (with `dry_run`) the matched `"paths"`
+
+    Raises:
+        ValueError: If no filter is given (which would delete every file).
     """
-    directory, removed = os.listdir(folder), []
-    for file in directory:
-        file = os.path.join(folder, file)
-        if file.split(".")[-1] in filetypes:
-            removed.append(file)
-            os.remove(file)
+    if not (
+        filetypes or older_than is not None or larger_than is not None or predicate
+    ):
+        _msg = "Give at least one file type or filter; refusing to delete every file"
+        raise ValueError(_msg)
+
+    cutoff = time.time() - older_than if older_than is not None else None
+    summary = {"matched": 0, "deleted": 0, "bytes": 0, "errors": []}
+    if dry_run:
+        summary["paths"] = []
+
+    def matches() -> Iterator[Tuple[str, int]]:
+        for entry in walk_files(
+            folder,
+            filetypes or None,
+            prune=prune if recursive else "*",
+            max_workers=1,
+            entries=True,
+        ):
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if (
+                (cutoff is not None and stat.st_mtime >= cutoff)
+                or (larger_than is not None and stat.st_size <= larger_than)
+                or (predicate and not predicate(entry))
+            ):
+                continue
+            summary["matched"] += 1
+            yield entry.path, stat.st_size
+
+    if dry_run:
+        for path, size in matches():
+            summary["bytes"] += size
+            summary["paths"].append(path)
+        return summary
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    batches, batch = [], []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for match in matches():
+            batch.append(match)
+            if len(batch) == batch_size:
+                batches.append(executor.submit(_unlink_batch, batch))
+                batch = []
+        if batch:
+            batches.append(executor.submit(_unlink_batch, batch))
+        for future in batches:
+            deleted, freed, errors = future.result()
+            summary["deleted"] += deleted
+            summary["bytes"] += freed
+            summary["errors"].extend(errors)
+
+    return summary
 
 
 def mkdirectory(*paths: str, display: bool = False) -> None:
@@ -46,12 +159,77 @@ def mkdirectory(*paths: str, display: bool = False) -> None:
             print("Directory already exists")
 
 
+def claim_unique_name(
+    filename: str = ...,
+    path: str = ".",
+    copy_pattern: str = "Run ",
+    claim: bool = True,
+    max_attempts: int = 1000,
+) -> Tuple[str, int]:
+    """
+    Picks the next free `<name> (<copy_pattern><N>)<ext>` in a directory and (optionally) claims it atomically.
+
+    Args:
+        filename (str): original name of file. Defaults to ...
+        path (str, optional): directory the file goes in. Defaults to ".".
+        copy_pattern (str): text before the number in the suffix. Defaults to "Run ".
+        claim (bool, optional): create the (empty) file with `O_CREAT | O_EXCL`, so no other process or thread can pick the same name. Defaults to True.
+        max_attempts (int, optional): number of names tried when other processes keep claiming them first. Defaults to 1000.
+
+    Returns:
+        Tuple[str, int]: the unique name, and its number (1 for the original name)
+
+    Raises:
+        FileExistsError: If no name could be claimed within `max_attempts`.
+
+    Notes:
+        The existing names are read in a single `os.scandir` pass, and numbering continues after the highest `(<copy_pattern><N>)` suffix found (gaps are not reused).
+    """
+    base_name, ext = os.path.splitext(filename)
+    numbered = re.compile(
+        rf"{re.escape(base_name)} \({re.escape(copy_pattern)}(\d+)\){re.escape(ext)}"
+    )
+
+    counter = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name == filename:
+                    counter = max(counter, 1)
+                elif match := numbered.fullmatch(entry.name):
+                    counter = max(counter, int(match.group(1)))
+    except FileNotFoundError:
+        pass
+
+    for counter in range(counter + 1, counter + 1 + max_attempts):
+        unique_name = (
+            filename if counter == 1 else f"{base_name} ({copy_pattern}{counter}){ext}"
+        )
+        if not claim:
+            return (unique_name, counter)
+        try:
+            os.close(
+                os.open(
+                    os.path.join(path, unique_name),
+                    os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                    0o666,
+                )
+            )
+            return (unique_name, counter)
+        except FileExistsError:  # claimed by someone else in the meantime
+            continue
+
+    _msg = f"Could not claim a unique name for '{filename}' in '{path}' after {max_attempts} attempts"
+    raise FileExistsError(_msg)
+
+
 def uniquefilename(
     filename: str = ...,
     path: str = os.path.dirname(
         os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     ),  # CWD
     copy_pattern: str = "Run ",
+    claim: bool = True,
 ) -> Tuple[str, int]:
     """
     Produces updating enumeration of consecutive file names
@@ -60,32 +238,363 @@ def uniquefilename(
         filename (str): original name of file. Defaults to ...
         path (str, optional): defualt directory for saving log files. Defaults to os.path.dirname(os.path.dirname(os.path.abspath(__file__))).
         copy_pattern (str): appended pattern. Defaults to "Run"
+        claim (bool, optional): reserve the name by creating the (empty) file, so concurrent callers get different names. Defaults to True.
 
     Returns:
         str: filename with unique number identifier appended to original filename
+
+    Notes:
+        See `claim_unique_name`.
     """
     # FIXME - fix rest argument for path
-    base_name, ext = os.path.splitext(filename)
-    unique_name, counter = filename, 1
-    while os.path.exists(os.path.join(path, unique_name)):
-        counter += 1
-        unique_name = f"{base_name} ({copy_pattern}{counter}){ext}"
+    return claim_unique_name(filename, path, copy_pattern, claim)
+
+
+def _compile_patterns(
+    patterns: str | Iterable[str] = None, extensions: bool = True
+) -> re.Pattern | None:
+    """
+    Compiles file name patterns into one regular expression (None matches everything).
+
+    With `extensions`, bare extensions (`"csv"` or `".csv"`) are turned into `"*.csv"`; everything else is used as a glob. Matching is case-insensitive where the OS's file names are (see `os.path.normcase`).
+    """
+    if patterns is None:
+        return None
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    globs = [
+        (
+            "*." + pattern.lstrip(".")
+            if extensions and not any(char in pattern for char in "*?[")
+            else pattern
+        )
+        for pattern in patterns
+    ]
+    return re.compile("|".join(translate(os.path.normcase(g)) for g in globs))
+
+
+def _read_ignore_file(path: str = None) -> List[str] | None:
+    """Reads the glob patterns (one per line, `#` for comments) of an ignore file, or None if there is none."""
+    try:
+        with open(path) as file:
+            return [
+                line.strip()
+                for line in file
+                if line.strip() and not line.startswith("#")
+            ]
+    except OSError:
+        return None
+
+
+def _scan_directory(
+    path: str = None,
+    files: re.Pattern | None = None,
+    prune: re.Pattern | None = None,
+    ignore_file: str = None,
+    ignored: re.Pattern | None = None,
+    follow_symlinks: bool = False,
+) -> Tuple[List[os.DirEntry], List[Tuple[str, re.Pattern | None]]]:
+    """
+    Lists one directory for `walk_files`.
+
+    Returns:
+        Tuple[List[os.DirEntry], List[Tuple[str, re.Pattern | None]]]: the matching files, and the subdirectories to descend into (each with the ignore patterns that apply below it)
+    """
+    if ignore_file:
+        patterns = _read_ignore_file(os.path.join(path, ignore_file))
+        if patterns:
+            local = "|".join(translate(os.path.normcase(p)) for p in patterns)
+            ignored = re.compile(f"{ignored.pattern}|{local}" if ignored else local)
+
+    matched, subdirs = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = os.path.normcase(entry.name)
+                if ignored and ignored.match(name):
+                    continue
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                except OSError:
+                    continue
+                if is_dir:
+                    if not (prune and prune.match(name)):
+                        subdirs.append((entry.path, ignored))
+                elif (files is None or files.match(name)) and entry.name != ignore_file:
+                    matched.append(entry)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        pass
+    return matched, subdirs
+
+
+def walk_files(
+    root: str = ...,
+    patterns: str | Iterable[str] = None,
+    prune: str | Iterable[str] = None,
+    ignore_file: str = None,
+    max_workers: int = None,
+    follow_symlinks: bool = False,
+    entries: bool = False,
+) -> Iterator[str] | Iterator[os.DirEntry]:
+    """
+    Lazily yields the files in a directory tree that match any of several patterns, in a single `os.scandir` pass.
+
+    Args:
+        root (str, optional): top directory to walk. Defaults to ....
+        patterns (str | Iterable[str], optional): extensions (`"csv"`, `".csv"`) or globs (`"run_*.log"`) matched against file names. Defaults to None (all files).
+        prune (str | Iterable[str], optional): globs of directory names that are not descended into (e.g., `[".git", "__pycache__"]`). Defaults to None.
+        ignore_file (str, optional): name of an ignore file (e.g., `".scanignore"`). Its globs (one per line) exclude matching file and directory names in its directory and below (an empty one excludes nothing). Defaults to None.
+        max_workers (int, optional): number of threads listing directories concurrently (helps on network and other high-latency filesystems). Use 1 to walk in this thread, which is usually faster on local disks. Defaults to None (`ThreadPoolExecutor`'s default).
+        follow_symlinks (bool, optional): descend into symbolic links to directories. Defaults to False.
+        entries (bool, optional): yield `os.DirEntry` objects (whose cached `stat` can be reused) instead of paths. Defaults to False.
+
+    Yields:
+        str | os.DirEntry: matching files, as soon as their directory has been listed (in no particular order when threaded)
+
+    Notes:
+        Unreadable or vanished directories are skipped.
+    """
+    files, prune = _compile_patterns(patterns), _compile_patterns(prune, False)
+
+    def scan(path: str, ignored: re.Pattern | None) -> Tuple[List, List]:
+        return _scan_directory(
+            path, files, prune, ignore_file, ignored, follow_symlinks
+        )
+
+    if max_workers == 1:
+        pending = [(os.fspath(root), None)]
+        while pending:
+            matched, subdirs = scan(*pending.pop())
+            yield from (entry if entries else entry.path for entry in matched)
+            pending.extend(reversed(subdirs))
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(scan, os.fspath(root), None)}
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                matched, subdirs = future.result()
+                futures.update(executor.submit(scan, *subdir) for subdir in subdirs)
+                yield from (entry if entries else entry.path for entry in matched)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
-    return (unique_name, counter)
+
+class DirectoryIndex:
+    """
+    Persistent, incremental index of the files in a directory tree, for finding what changed since the last scan.
+
+    The path, size, modification time, inode, and (optionally) content hash of every file are kept in a SQLite database together with the modification time of every directory. A rescan stats each directory once, but only lists and stats the files of directories whose modification time changed (i.e., where files were created, deleted, or renamed); the subdirectories of unchanged directories are taken from the index.
+
+    Attributes:
+        root (str): Top directory of the tree.
+        db_path (str): Path to the SQLite database.
+        hash_algorithm (str | None): `hashlib` algorithm used to hash file contents, if any.
+
+    Args:
+        root (str=None): Top directory of the tree.
+        db_path (str=None): Path to the SQLite database. Defaults to `.dirindex.sqlite` in `root` (which, like its journal file, is excluded from the index).
+        patterns (str|Iterable[str]=None): Extensions or globs of the files to index (see `walk_files`). Defaults to all files.
+        prune (str|Iterable[str]=None): Globs of directory names that are not indexed.
+        hash_algorithm (str=None): `hashlib` algorithm (e.g., `"sha1"`) for content hashes. With hashes, a file whose size or time changed but whose contents didn't is not reported as modified.
+
+    Notes:
+        Editing a file in place does not change its directory's modification time, so such edits are only seen by `scan(full=True)`. Files written to a temporary name and then renamed (or deleted and re-created) are always detected.
+
+    Example:
+        >>> with DirectoryIndex("results", patterns="csv") as index:
+        ...     changes = index.scan()
+        >>> changes["added"]
+    """
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS dirs (
+            path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY, dir TEXT, size INTEGER, mtime_ns INTEGER,
+            inode INTEGER, hash TEXT
+        );
+        CREATE INDEX IF NOT EXISTS files_dir ON files (dir);
+    """
+
+    def __init__(
+        self,
+        root: str = None,
+        db_path: str = None,
+        patterns: str | Iterable[str] = None,
+        prune: str | Iterable[str] = None,
+        hash_algorithm: str = None,
+    ) -> None:
+        self.root = os.path.abspath(root)
+        self.db_path = db_path or os.path.join(self.root, ".dirindex.sqlite")
+        self.hash_algorithm = hash_algorithm
+        self._files = _compile_patterns(patterns)
+        self._prune = _compile_patterns(prune, False)
+        self._connection = sqlite3.connect(self.db_path)
+        # truncate the rollback journal instead of deleting it after every
+        # transaction, so the database's directory keeps its modification time
+        self._connection.execute("PRAGMA journal_mode = TRUNCATE")
+        self._connection.executescript(self._schema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the indexed file paths (as of the last scan), like `DirectoryFileIterator`."""
+        rows = self._connection.execute("SELECT path FROM files ORDER BY path")
+        return (path for (path,) in rows)
+
+    def _hash(self, path: str = None) -> str | None:
+        if not self.hash_algorithm:
+            return None
+        try:
+            digest = hashlib.new(self.hash_algorithm)
+            with open(path, "rb") as file:
+                while chunk := file.read(1024**2):
+                    digest.update(chunk)
+            return digest.hexdigest()
+        except OSError:
+            return None
+
+    def _excluded(self, name: str = None) -> bool:
+        """Whether a file name is the database itself (or one of its journal files)."""
+        return name.startswith(os.path.basename(self.db_path))
+
+    def _scan_files(
+        self, path: str = None, changes: Dict[str, List[str]] = None
+    ) -> List[str]:
+        """Lists a (changed) directory, records its file changes, and returns its subdirectories."""
+        db = self._connection
+        known = {
+            row[0]: row[1:]
+            for row in db.execute(
+                "SELECT path, size, mtime_ns, inode, hash FROM files WHERE dir = ?",
+                (path,),
+            )
+        }
+        subdirs, rows = [], []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = os.path.normcase(entry.name)
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not (self._prune and self._prune.match(name)):
+                                subdirs.append(entry.path)
+                            continue
+                        if (self._files and not self._files.match(name)) or (
+                            path == self.root and self._excluded(entry.name)
+                        ):
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+
+                    signature = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+                    old = known.pop(entry.path, None)
+                    if old is not None and old[:3] == signature:
+                        continue
+                    digest = self._hash(entry.path)
+                    if old is None:
+                        changes["added"].append(entry.path)
+                    elif digest is None or digest != old[3]:
+                        changes["modified"].append(entry.path)
+                    rows.append((entry.path, path, *signature, digest))
+        except OSError:
+            pass
+
+        db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)", rows)
+        db.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in known])
+        changes["deleted"].extend(known)
+        return subdirs
+
+    def scan(self, full: bool = False) -> Dict[str, List[str]]:
+        """
+        Updates the index and reports the files that changed since the last scan (on the first scan, every file is "added").
+
+        Args:
+            full (bool, optional): list and stat every directory's files, to also catch files edited in place. Defaults to False.
+
+        Returns:
+            Dict[str, List[str]]: sorted paths of the `"added"`, `"modified"`, and `"deleted"` files
+        """
+        db = self._connection
+        known_dirs, children = {}, {}
+        for path, parent, mtime_ns in db.execute("SELECT * FROM dirs"):
+            known_dirs[path] = mtime_ns
+            children.setdefault(parent, []).append(path)
+
+        changes = {"added": [], "modified": [], "deleted": []}
+        seen, pending = [], [self.root]
+        with db:  # one transaction
+            while pending:
+                path = pending.pop()
+                try:
+                    mtime_ns = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                seen.append((path, os.path.dirname(path), mtime_ns))
+                if not full and known_dirs.get(path) == mtime_ns:
+                    pending.extend(children.get(path, ()))
+                else:
+                    pending.extend(self._scan_files(path, changes))
+
+            # Files of directories that are gone (or now pruned)
+            gone = set(known_dirs).difference(path for path, _, _ in seen)
+            for path in gone:
+                rows = db.execute("SELECT path FROM files WHERE dir = ?", (path,))
+                changes["deleted"].extend(p for (p,) in rows)
+                db.execute("DELETE FROM files WHERE dir = ?", (path,))
+            db.executemany("DELETE FROM dirs WHERE path = ?", [(p,) for p in gone])
+            db.executemany("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?)", seen)
+
+        return {kind: sorted(paths) for kind, paths in changes.items()}
+
+    def close(self) -> None:
+        self._connection.close()
 
 
-def file_filter(parent_folder: str = ..., file_type: str = ...) -> List[str]:
+def file_filter(
+    parent_folder: str = ...,
+    file_type: str | Sequence[str] = ...,
+    prune: str | Iterable[str] = ".*",
+    max_workers: int = 1,
+    hidden: bool = False,
+) -> List[str]:
     """
     Fetches all files recursively in a desired directory and all its subdirectories.
 
     Args:
         parent_folder (str, optional): path to folder you want to parse. Defaults to ....
-        file_type (str, optional): file extension you are searching for. Defaults to ....
+        file_type (str | Sequence[str], optional): file extension(s) or glob(s) you are searching for. Defaults to ....
+        prune (str | Iterable[str], optional): globs of directory names to skip. Defaults to ".*" (hidden directories, which `glob` skipped as well).
+        max_workers (int, optional): number of threads listing directories (results then come back in no particular order). Defaults to 1 (this thread, which is fastest on local disks).
+        hidden (bool, optional): also return hidden files (names starting with "."), which `glob` skipped. Defaults to False.
 
     Returns:
         List of strings of absolute paths of every file that fits 'file_type.'
+
+    Notes:
+        Built on `walk_files`; iterate over that directly to get results lazily.
     """
-    return glob.glob(parent_folder + "/**/" + file_type, recursive=True)
+    return [
+        path
+        for path in walk_files(
+            parent_folder, file_type, prune=prune, max_workers=max_workers
+        )
+        if hidden or not os.path.basename(path).startswith(".")
+    ]
 
 
 def joinpths(*paths: str) -> str:
@@ -111,12 +620,78 @@ def listdir(path: str = None) -> List[str]:
     return glob.glob(pathname=path)
 
 
+def newest_files(
+    path: str = ...,
+    n: int = 1,
+    key: Literal["mtime", "ctime", "name"] = "mtime",
+    oldest: bool = False,
+    keyword: str = None,
+    regex: str | re.Pattern = None,
+    recursive: bool = False,
+    include_dirs: bool = False,
+) -> List[str]:
+    """
+    Finds the newest (or oldest) `n` files in a directory in a single pass, keeping only the current top `n` in a heap.
+
+    Args:
+        path (str, optional): directory to search. Defaults to ....
+        n (int, optional): number of files to return. Defaults to 1.
+        key (Literal["mtime", "ctime", "name"], optional): what "newest" means: latest modification time, latest `ctime` (creation time on Windows, metadata change time elsewhere), or last name in sort order. Defaults to "mtime".
+        oldest (bool, optional): return the oldest (first) files instead. Defaults to False.
+        keyword (str, optional): only consider names containing this string. Defaults to None.
+        regex (str | re.Pattern, optional): only consider names matching this regular expression (`re.search`). Defaults to None.
+        recursive (bool, optional): search subdirectories too (see `walk_files`). Defaults to False.
+        include_dirs (bool, optional): also consider subdirectories (non-recursive searches only). Defaults to False.
+
+    Returns:
+        List[str]: paths of the selected files, newest first (oldest first with `oldest`)
+
+    Notes:
+        Times come from `DirEntry.stat()` (which needs no extra system call on Windows), and names are filtered before anything is stat-ed. The search costs O(files * log(n)) time and O(n) memory.
+    """
+    if isinstance(regex, str):
+        regex = re.compile(regex)
+
+    def candidates() -> Iterator[Tuple[int | str, str]]:
+        if recursive:
+            entries = walk_files(path, max_workers=1, entries=True)
+        else:
+            entries = os.scandir(path)
+        try:
+            for entry in entries:
+                name = entry.name
+                if (keyword and keyword not in name) or (
+                    regex and not regex.search(name)
+                ):
+                    continue
+                try:
+                    if not (recursive or include_dirs or entry.is_file()):
+                        continue
+                    if key == "name":
+                        yield name, entry.path
+                    else:
+                        stat = entry.stat()
+                        time_ns = (
+                            stat.st_mtime_ns if key == "mtime" else stat.st_ctime_ns
+                        )
+                        yield time_ns, entry.path
+                except OSError:  # vanished while scanning
+                    continue
+        finally:
+            entries.close()
+
+    select = heapq.nsmallest if oldest else heapq.nlargest
+    return [entry_path for _, entry_path in select(n, candidates())]
+
+
 def find_last_file(
     path: str = ...,
     keyword: str = None,
     fetch: int = None,
     usetime: bool = False,
     showcase: bool = False,
+    recursive: bool = False,
+    key: Literal["mtime", "ctime", "name"] = "mtime",
 ):
     """
     Finds the last files in a directory depending on keyword or just last integer-amount of files.
@@ -130,71 +705,81 @@ def find_last_file(
     fetch : int, optional
         Integer amount of (last) files to fetch, by default None
     usetime : bool, optional
-        Option to find the files if based on their times, by default False
+        Option to find the last file by its creation (`ctime`) time and return it with a message; overrides `key`, by default False
     showcase : bool, optional
         Option to print the findings (if not already done manually), by default False
+    recursive : bool, optional
+        Option to search subdirectories too (names are then returned relative to `path`), by default False
+    key : Literal["mtime", "ctime", "name"], optional
+        What "last" means: latest modification time, latest `ctime`, or last name in sort order (see `newest_files`), by default "mtime"
 
     Returns
     -------
     List
-        List of files found (as absolute paths).
-    """
-    if usetime:
-        files = os.listdir(path)
-        paths = [
-            os.path.join(path, basename).replace(os.path.sep, "/") for basename in files
-        ]
-        temp = max(paths, key=os.path.getctime).replace(os.path.sep, "/")
-        temp = os.path.basename(temp)
-        print(f"Returned last file using key:", temp)
+        List of files found (names, oldest to newest), or a single name if `fetch` is not given.
+
+    Notes
+    -----
+    Built on `newest_files`, so only the last `fetch` names are kept while the directory is scanned.
+    """
+    temp = [
+        os.path.relpath(found, path)
+        for found in newest_files(
+            path,
+            fetch or 1,
+            key="ctime" if usetime else key,
+            keyword=keyword,
+            recursive=recursive,
+            include_dirs=True,
+        )[::-1]
+    ]
+    if showcase and keyword is not None:
+        if temp:
+            [
+                print(f"Found '{item}' in '{path}' with keyword '{keyword}'")
+                for item in temp
+            ]
+        else:
+            print(f"No items found in '{path}' with keyword '{keyword}'")
+
+    if usetime and not fetch:
+        if temp:
+            print(f"Returned last file using key:", temp[-1])
+            return temp[-1]
+        return None
+
+    if fetch:
+        if fetch > len(temp):
+            number1 = num_to_word(len(temp))
+
+            if keyword and showcase:
+                _msg = (
+                    f"Returning last {number1} files with keyword '{keyword}': {temp}"
+                )
+                print(_msg)
+            elif showcase:
+                _msg = f"Returning last {number1}: {temp} "
+                print(_msg)
+        else:
+            number = num_to_word(abs(fetch))
+            if showcase:
+                print(
+                    (
+                        f"Returned last {number} files with keyword '{keyword}': {temp}"
+                        if keyword
+                        else f"Returning last {number} files:"
+                    ),
+                    temp,
+                )
+
         return temp
     else:
-        temp = os.listdir(path)
-        if keyword is not None:
-            try:
-                temp = [ind for ind in temp if keyword in ind]
-                if showcase:
-                    [
-                        print(f"Found '{item}' in '{path}' with keyword '{keyword}'")
-                        for item in temp
-                    ]
-            except:
-                print(f"No items found in '{path}' with keyword '{keyword}'")
-
-        if fetch:
-            temp = temp[-fetch:]
-            if fetch == 0:
-                print(f"Returned last file")
-            else:
-                if fetch > len(temp):
-                    number = num_to_word(abs(fetch))
-                    number1 = num_to_word(len(temp))
-
-                    if keyword and showcase:
-                        _msg = f"Returning last {number1} files with keyword '{keyword}': {temp}"
-                        print(_msg)
-                    elif showcase:
-                        _msg = f"Returning last {number1}: {temp} "
-                        print(_msg)
-                else:
-                    number = num_to_word(abs(fetch))
-                    if showcase:
-                        print(
-                            f"Returned last {number} files with keyword '{keyword}': {temp}"
-                            if keyword
-                            else f"Returning last {number} files:",
-                            temp,
-                        )
+        if temp:
+            lastfile = temp[-1]
+            if showcase:
+                print(f"Returned last file: '{lastfile}'")
+            return lastfile
+        if showcase:
+            print(f"No items found in '{path}' with keyword '{keyword}'")
 
-            return temp
-        else:
-            try:
-                lastfile = temp[-1]
-                if showcase:
-                    print(f"Returned last file: '{lastfile}'")
-                return lastfile
-            except:
-                if showcase:
-                    print(f"No items found in '{path}' with keyword '{keyword}'")
-
-                return None
+        return None
@@ -11,10 +11,11 @@ Script Symbols
 ---------------
 - class `ObjIterator`
 - class `DirectoryFileIterator`
+- class `ArchiveFileIterator`
 """
 
 import os
-from typing import Iterable
+from typing import IO, Iterable, Sequence, Tuple
 
 
 class ObjIterator:
@@ -72,3 +73,52 @@ class DirectoryFileIterator:
         file_path = os.path.join(self.directory_path, self.files[self.index])
         self.index += 1
         return file_path
+
+
+class ArchiveFileIterator:
+    """
+    Iterate through the files in a ZIP or `.tar` archive without extracting it, like `DirectoryFileIterator` does for a directory.
+
+    Attributes:
+        archive_path (type): Archive to iterate through.
+        reader (type): `ArchiveReader` over the archive (its member index is cached next to tar archives).
+        files (type): Member names in that archive.
+        index (type): Iteration index.
+
+    Args:
+        archive_path (str=None): Path to the archive.
+        pattern (str|Sequence[str]=None): Glob pattern(s) the member names must match.
+
+    Notes:
+        Each iteration returns a `(name, file object)` pair; close the file object once it has been read. The archive itself is closed once iteration is exhausted, or on `close()` (or leaving a `with` block).
+    """
+
+    def __init__(
+        self, archive_path: str = None, pattern: str | Sequence[str] = None
+    ) -> None:
+        from .datahelpers import ArchiveReader
+
+        self.archive_path = archive_path
+        self.reader = ArchiveReader(archive_path)
+        self.files = self.reader.glob(pattern) if pattern else self.reader.names
+        self.index = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Tuple[str, IO[bytes]]:
+        if self.index >= len(self.files):
+            self.close()
+            raise StopIteration
+        name = self.files[self.index]
+        self.index += 1
+        return name, self.reader.open(name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.reader.close()
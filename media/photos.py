@@ -14,8 +14,6 @@ Script Information
 from glob import glob
 from typing import Literal
 
-from PIL import Image
-
 
 def make_gif(
     frame_dir: str = None,
@@ -36,6 +34,8 @@ def make_gif(
         loop (int, optional): Option to loop gif a limited amount of times. Defaults to 0.
         save_as (str, optional): Filename of gif. Defaults to None.
     """
+    from PIL import Image  # deferred, so importing the package does not load Pillow
+
     images = [
         Image.open(image)
         for image in glob("{}\\*.{}".format(frame_dir, frame_type.replace(".", "")))
@@ -74,7 +74,7 @@ class LoggerBackend:
                 )
 
             log_file = LoggerBackend.generate_unique_name(log_file)
-            # Define the log file name and create a file handler
+            # Define the log file name and create a file handler (for the claimed file)
             file_handler = logging.FileHandler(log_file)
             file_handler.setLevel(log_level)
             file_handler.setFormatter(formatter)
@@ -91,26 +91,28 @@ class LoggerBackend:
     @staticmethod
     def generate_unique_name(
         filename: str = ...,
-        path: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__))),  # CWD
+        path: str = None,
         copy_pattern: str = "Run",
     ):
         """Static function for producing updating enumeration of consecutive log files.
 
         Args:
-                filename (str): original name of file. Defaults to ...
-                path (str, optional): defualt directory for saving log files. Defaults to os.path.dirname(os.path.dirname(os.path.abspath(__file__))).
+                filename (str): original name of file (may include its directory). Defaults to ...
+                path (str, optional): directory for saving log files. Defaults to None (the directory in `filename`, or the current working directory).
                 copy_pattern (str): appended pattern. Defaults to "Run"
 
         Returns:
-                str: filename with unique number identifier appended to original filename
+                str: path of the log file, with unique number identifier appended to original filename
+
+        Notes:
+                The returned file is claimed by creating it (empty), so concurrent runs never share a log file (see `dirhelpers.claim_unique_name`).
         """
-        base_name, ext = os.path.splitext(filename)
-        unique_name, counter = filename, 1
-        while os.path.exists(os.path.join(path, unique_name)):
-            counter += 1
-            unique_name = f"{base_name} ({copy_pattern} {counter}){ext}"
+        from ..dirhelpers import claim_unique_name
 
-        return unique_name
+        if path is None:
+            path, filename = os.path.split(filename)
+        unique_name, _ = claim_unique_name(filename, path or ".", f"{copy_pattern} ")
+        return os.path.join(path, unique_name)
 
 
 class Logger(LoggerBackend):
@@ -14,6 +14,7 @@ Script Symbols
 - class `MissingArgumentsWarning`
 - class `FutureImplementationWarning`
 - class `WorkInProgressWarning`
+- class `UnavoidableCopyWarning`
 """
 
 
@@ -32,3 +33,9 @@ class WorkInProgressWarning(UserWarning):
     Warns the user that the code is being worked on and it might not work as
     intened or as the documentation describes.
     """
+
+
+class UnavoidableCopyWarning(UserWarning):
+    """
+    Warns the user that data had to be copied where a zero-copy view was requested.
+    """